@@ -12,7 +12,12 @@ import asyncio
 from pathlib import Path
 
 from demo.status import demo_status
-from demo.tikv_chaos import kill_random_tikv, restart_container, start_ycsb_load
+from demo.tikv_chaos import (
+    kill_random_tikv,
+    pick_random_tikv,
+    restart_container,
+    start_ycsb_load,
+)
 from demo.types import Chapter
 
 
@@ -66,6 +71,9 @@ def create_fault_chapter(compose_file: Path) -> Chapter:
         """Run countdown then kill random TiKV node."""
         global _killed_container
 
+        # Pick the target (compose ps + inspects) behind the countdown
+        target_task = asyncio.create_task(pick_random_tikv(compose_file))
+
         # Countdown (update status instead of print to avoid TUI interference)
         for i in range(3, 0, -1):
             demo_status.set(f"Injecting fault in {i}...")
@@ -74,7 +82,8 @@ def create_fault_chapter(compose_file: Path) -> Chapter:
         demo_status.set("FAULT INJECTED!")
 
         # Kill random TiKV
-        container = await kill_random_tikv(compose_file)
+        target = await target_task
+        container = await kill_random_tikv(compose_file, target) if target else None
         if container:
             _killed_container = container
             demo_status.set(f"Killed container: {container}")
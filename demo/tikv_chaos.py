@@ -2,54 +2,92 @@
 TiKV chaos injection functions for demo framework.
 
 This module provides TiKV-specific chaos functions:
+- pick_random_tikv: Choose a running TiKV store container
 - kill_random_tikv: Kill random TiKV store container with SIGKILL
 - restart_container: Restart a stopped container
 - TIKV_CHAOS_CONFIG: ChaosConfig for node kill scenario
 
 Adapted from operator_core/tui/fault.py and operator_core/demo/chaos.py patterns.
+
+python-on-whales shells out to the docker CLI, so every call runs via
+asyncio.to_thread to keep the TUI event loop responsive.
 """
 
+import asyncio
 import random
+import re
 from pathlib import Path
 
-from python_on_whales import DockerClient
+from operator_core.deploy import get_docker_client
 
 from demo.types import ChaosConfig, ChaosType
 
+# Case-insensitive "tikv" anywhere in a container name
+_TIKV_IN_NAME = re.compile(r"tikv", re.IGNORECASE)
+
+
+def _pick_random_tikv(compose_file: Path) -> str | None:
+    """Choose a running TiKV container (blocking: ps plus lazy inspects)."""
+    docker = get_docker_client(compose_file)
+
+    # Get running TiKV containers
+    containers = docker.compose.ps()
+    tikv_names = []
+    for c in containers:
+        # Each lazy attribute access re-inspects, so read the name once
+        name = c.name
+        if _TIKV_IN_NAME.search(name) and c.state.running:
+            tikv_names.append(name)
+
+    if not tikv_names:
+        return None
+
+    # Random selection
+    return random.choice(tikv_names)
+
 
-async def kill_random_tikv(compose_file: Path) -> str | None:
+async def pick_random_tikv(compose_file: Path) -> str | None:
     """
-    Kill a random TiKV store container with SIGKILL.
+    Choose a running TiKV store container to kill.
 
-    Simulates sudden node failure (crash, hardware fault, network partition).
+    Split from kill_random_tikv so callers can pick the target ahead of
+    time (e.g. during a countdown) and only pay for the kill itself.
 
     Args:
         compose_file: Path to docker-compose.yaml
 
     Returns:
-        Name of killed container, or None if no targets found
+        Name of chosen container, or None if no targets found
     """
-    docker = DockerClient(compose_files=[compose_file])
+    return await asyncio.to_thread(_pick_random_tikv, compose_file)
 
-    # Get running TiKV containers
-    containers = docker.compose.ps()
-    tikv_containers = [
-        c
-        for c in containers
-        if "tikv" in c.name.lower() and c.state.running
-    ]
 
-    if not tikv_containers:
-        return None
+async def kill_random_tikv(
+    compose_file: Path, target: str | None = None
+) -> str | None:
+    """
+    Kill a random TiKV store container with SIGKILL.
 
-    # Random selection
-    target = random.choice(tikv_containers)
-    container_name = target.name
+    Simulates sudden node failure (crash, hardware fault, network partition).
+
+    Args:
+        compose_file: Path to docker-compose.yaml
+        target: Container chosen earlier by pick_random_tikv; chosen now
+            when omitted
+
+    Returns:
+        Name of killed container, or None if no targets found
+    """
+    if target is None:
+        target = await pick_random_tikv(compose_file)
+        if target is None:
+            return None
 
     # Kill with SIGKILL (immediate, no cleanup)
-    docker.kill(container_name)
+    docker = get_docker_client(compose_file)
+    await asyncio.to_thread(docker.kill, target)
 
-    return container_name
+    return target
 
 
 async def restart_container(compose_file: Path, container_name: str) -> bool:
@@ -63,18 +101,13 @@ async def restart_container(compose_file: Path, container_name: str) -> bool:
     Returns:
         True if restart successful, False otherwise
     """
-    docker = DockerClient(compose_files=[compose_file])
+    docker = get_docker_client(compose_file)
 
     try:
-        # Extract service name from container name
-        # Container names may have project prefix: "operator-tikv-tikv0-1" -> "tikv0"
-        service_name = container_name
-        for part in container_name.split("-"):
-            if part.startswith("tikv") and len(part) > 4:
-                service_name = part
-                break
-
-        docker.compose.start(services=[service_name])
+        # SIGKILL leaves the container in place, so start it directly by
+        # name; going through compose would re-resolve the project and
+        # list its containers just to find the same one
+        await asyncio.to_thread(docker.container.start, container_name)
         return True
     except Exception:
         return False
@@ -92,12 +125,13 @@ async def start_ycsb_load(compose_file: Path) -> bool:
     Returns:
         True if YCSB started successfully, False otherwise
     """
-    docker = DockerClient(compose_files=[compose_file])
+    docker = get_docker_client(compose_file)
 
     try:
         # Run YCSB load phase first (creates initial data)
         # tty=False prevents terminal output from interfering with TUI
-        docker.compose.run(
+        await asyncio.to_thread(
+            docker.compose.run,
             "ycsb",
             command=[
                 "load", "tikv",
@@ -111,7 +145,8 @@ async def start_ycsb_load(compose_file: Path) -> bool:
         )
 
         # Run YCSB workload in background
-        docker.compose.run(
+        await asyncio.to_thread(
+            docker.compose.run,
             "ycsb",
             command=[
                 "run", "tikv",
@@ -17,6 +17,9 @@ import httpx
 
 from demo.types import HealthPollerProtocol
 
+# Keep-alive pool shared by every poll (PD and Prometheus are polled repeatedly)
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30)
+
 
 class TiKVHealthPoller(HealthPollerProtocol):
     """
@@ -45,6 +48,7 @@ class TiKVHealthPoller(HealthPollerProtocol):
         self,
         pd_endpoint: str = "http://localhost:2379",
         poll_interval: float = 2.0,
+        prometheus_url: str = "http://localhost:9090",
     ) -> None:
         """
         Initialize TiKV health poller.
@@ -52,8 +56,10 @@ class TiKVHealthPoller(HealthPollerProtocol):
         Args:
             pd_endpoint: Base URL for PD API (default: http://localhost:2379)
             poll_interval: Seconds between health polls (default: 2.0)
+            prometheus_url: Base URL for Prometheus API (default: http://localhost:9090)
         """
         self._pd_endpoint = pd_endpoint
+        self._prometheus_url = prometheus_url
         self._poll_interval = poll_interval
         self._shutdown = asyncio.Event()
         self._health: dict[str, Any] | None = None
@@ -64,14 +70,22 @@ class TiKVHealthPoller(HealthPollerProtocol):
 
         Polls PD API at configured interval until stop() is called.
         On API failure, continues polling without crashing.
+
+        PD and Prometheus clients are opened once and reused for every poll
+        so keep-alive connections stay warm.
         """
         async with httpx.AsyncClient(
             base_url=self._pd_endpoint,
             timeout=5.0,
-        ) as client:
+            limits=HTTP_LIMITS,
+        ) as client, httpx.AsyncClient(
+            base_url=self._prometheus_url,
+            timeout=5.0,
+            limits=HTTP_LIMITS,
+        ) as prom_client:
             while not self._shutdown.is_set():
                 try:
-                    self._health = await self._fetch_health(client)
+                    self._health = await self._fetch_health(client, prom_client)
                 except Exception:
                     # On failure, continue polling without crashing
                     # Health remains at last successful value or None
@@ -85,7 +99,11 @@ class TiKVHealthPoller(HealthPollerProtocol):
                 except asyncio.TimeoutError:
                     continue
 
-    async def _fetch_health(self, client: httpx.AsyncClient) -> dict[str, Any]:
+    async def _fetch_health(
+        self,
+        client: httpx.AsyncClient,
+        prom_client: httpx.AsyncClient,
+    ) -> dict[str, Any]:
         """
         Fetch health from PD API endpoints.
 
@@ -94,7 +112,8 @@ class TiKVHealthPoller(HealthPollerProtocol):
         2. GET /pd/api/v1/health - PD member health
 
         Args:
-            client: Configured httpx client
+            client: Configured httpx client for PD
+            prom_client: Configured httpx client for Prometheus
 
         Returns:
             Health dict with nodes list, has_issues flag, and timestamp
@@ -141,7 +160,7 @@ class TiKVHealthPoller(HealthPollerProtocol):
             })
 
         # 3. Get ops/sec from Prometheus (if available)
-        ops_per_sec = await self._fetch_ops_per_sec(client)
+        ops_per_sec = await self._fetch_ops_per_sec(prom_client)
 
         return {
             "nodes": nodes,
@@ -150,38 +169,33 @@ class TiKVHealthPoller(HealthPollerProtocol):
             "ops_per_sec": ops_per_sec,
         }
 
-    async def _fetch_ops_per_sec(self, client: httpx.AsyncClient) -> float | None:
+    async def _fetch_ops_per_sec(self, prom_client: httpx.AsyncClient) -> float | None:
         """
         Fetch TiKV ops/sec from Prometheus.
 
         Queries the tikv_grpc_msg_duration_seconds_count rate for overall throughput.
 
         Args:
-            client: Configured httpx client
+            prom_client: Configured httpx client for Prometheus
 
         Returns:
             ops/sec value if available, None otherwise
         """
         try:
             # Query Prometheus for TiKV gRPC request rate
-            prom_client = httpx.AsyncClient(
-                base_url="http://localhost:9090",
-                timeout=5.0,
+            query = 'sum(rate(tikv_storage_engine_async_request_total[30s]))'
+            resp = await prom_client.get(
+                "/api/v1/query",
+                params={"query": query},
             )
-            async with prom_client:
-                query = 'sum(rate(tikv_storage_engine_async_request_total[30s]))'
-                resp = await prom_client.get(
-                    "/api/v1/query",
-                    params={"query": query},
-                )
-                resp.raise_for_status()
-                data = resp.json()
-
-                # Parse Prometheus response
-                results = data.get("data", {}).get("result", [])
-                if results:
-                    value = results[0].get("value", [None, "0"])
-                    return float(value[1])
+            resp.raise_for_status()
+            data = resp.json()
+
+            # Parse Prometheus response
+            results = data.get("data", {}).get("result", [])
+            if results:
+                value = results[0].get("value", [None, "0"])
+                return float(value[1])
         except Exception:
             pass  # Prometheus not available or query failed
 
@@ -13,6 +13,7 @@ Per RESEARCH.md Pattern 3: OutputBuffer with deque
 
 from collections import deque
 from collections.abc import Iterator
+from itertools import islice
 
 
 class OutputBuffer:
@@ -58,12 +59,15 @@ class OutputBuffer:
             n: Number of lines to return, or None for all lines
 
         Returns:
-            List of lines, newest last
+            List of lines, newest last (empty when n <= 0)
         """
-        lines = list(self._buffer)
-        if n is not None:
-            return lines[-n:]
-        return lines
+        if n is None or n >= len(self._buffer):
+            return list(self._buffer)
+        if n <= 0:
+            return []
+        # Copy only the tail instead of the whole buffer
+        start = len(self._buffer) - n
+        return list(islice(self._buffer, start, None))
 
     def get_text(self, n: int | None = None) -> str:
         """
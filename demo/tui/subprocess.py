@@ -176,14 +176,16 @@ class SubprocessManager:
         Terminate all managed subprocesses.
 
         Sets shutdown event first to signal reader tasks, then
-        terminates each process.
+        terminates all processes concurrently, so shutdown takes as long
+        as the slowest process rather than the sum of all of them.
 
         Args:
             timeout: Seconds to wait for each process before SIGKILL
         """
         self._shutdown.set()
-        for name in list(self._processes.keys()):
-            await self.terminate(name, timeout=timeout)
+        await asyncio.gather(
+            *(self.terminate(name, timeout=timeout) for name in list(self._processes))
+        )
 
     def get_buffer(self, name: str) -> OutputBuffer | None:
         """
@@ -27,6 +27,7 @@ Usage:
 import asyncio
 import functools
 import signal
+import time
 from pathlib import Path
 from typing import Any
 
@@ -48,6 +49,11 @@ from demo.types import Chapter, DemoState, HealthPollerProtocol
 UP_SYMBOL = "\u25cf"  # ● (filled circle)
 DOWN_SYMBOL = "\u2717"  # ✗ (cross mark)
 
+# Event-loop watchdog: wake every interval and report oversleeps beyond
+# the threshold, which mean something blocked the loop (stuttering TUI)
+LOOP_WATCHDOG_INTERVAL = 0.05
+LOOP_LAG_THRESHOLD = 0.05
+
 
 class TUIDemoController:
     """
@@ -104,6 +110,12 @@ class TUIDemoController:
         self._demo_state = DemoState(chapters=chapters)
         self._current_task: asyncio.Task[None] | None = None
 
+        # Inputs each panel was last built from (skip unchanged rebuilds)
+        self._panel_inputs: dict[str, object] = {}
+
+        # Worst event-loop lag seen by the watchdog (shown in narration)
+        self._max_loop_lag = 0.0
+
     async def run(self) -> None:
         """
         Run the TUI demo until shutdown signal.
@@ -182,6 +194,8 @@ class TUIDemoController:
                     tg.create_task(self._keyboard.run())
                     # Update loop
                     tg.create_task(self._update_loop(live))
+                    # Flags blocking calls that stall rendering
+                    tg.create_task(self._loop_watchdog())
             except* Exception:
                 pass  # TaskGroup handles cancellation
 
@@ -288,12 +302,21 @@ class TUIDemoController:
         status = demo_status.get()
         status_line = f"[bold]► {status}[/bold]\n\n" if status else ""
 
-        # Build content with status at top, then title, narration, and key hint
-        content = f"{status_line}[bold cyan]{chapter.title}[/bold cyan] {progress}\n\n{chapter.narration}\n\n{chapter.key_hint}"
-        self._layout["main"]["narration"].update(
-            make_panel(content, "Chapter", "magenta")
+        # Loop stalls are reported here, not via console output, which
+        # would scroll above the Live layout
+        lag_line = (
+            f"\n\n[dim]max event-loop lag {self._max_loop_lag * 1000:.0f}ms[/dim]"
+            if self._max_loop_lag
+            else ""
         )
 
+        # Build content with status at top, then title, narration, and key hint
+        content = f"{status_line}[bold cyan]{chapter.title}[/bold cyan] {progress}\n\n{chapter.narration}\n\n{chapter.key_hint}{lag_line}"
+        if self._panel_changed("narration", content):
+            self._layout["main"]["narration"].update(
+                make_panel(content, "Chapter", "magenta")
+            )
+
     async def _execute_chapter_callback(self, chapter: Chapter) -> None:
         """
         Execute chapter's on_enter callback and handle auto-advance.
@@ -344,6 +367,22 @@ class TUIDemoController:
             except asyncio.TimeoutError:
                 pass  # Normal refresh interval
 
+    async def _loop_watchdog(self) -> None:
+        """
+        Record event-loop stalls until shutdown.
+
+        Sleeps for a short fixed interval and measures how late it wakes up.
+        Lag beyond LOOP_LAG_THRESHOLD means a blocking call held the loop,
+        which shows up as a frozen countdown or panel. The worst lag is
+        shown in the narration panel on its next refresh.
+        """
+        while not self._shutdown.is_set():
+            start = time.monotonic()
+            await asyncio.sleep(LOOP_WATCHDOG_INTERVAL)
+            lag = time.monotonic() - start - LOOP_WATCHDOG_INTERVAL
+            if lag > LOOP_LAG_THRESHOLD:
+                self._max_loop_lag = max(self._max_loop_lag, lag)
+
     def _refresh_panels(self) -> None:
         """
         Refresh panel contents from subprocess output and health status.
@@ -373,16 +412,20 @@ class TUIDemoController:
         # Update monitor panel
         monitor_buf = self._subprocess_mgr.get_buffer("monitor")
         if monitor_buf:
-            self._layout["main"]["monitor"].update(
-                make_panel(monitor_buf.get_text(n=monitor_lines), "Monitor", "blue")
-            )
+            monitor_text = monitor_buf.get_text(n=monitor_lines)
+            if self._panel_changed("monitor", monitor_text):
+                self._layout["main"]["monitor"].update(
+                    make_panel(monitor_text, "Monitor", "blue")
+                )
 
         # Update agent panel
         agent_buf = self._subprocess_mgr.get_buffer("agent")
         if agent_buf:
-            self._layout["main"]["agent"].update(
-                make_panel(agent_buf.get_text(n=agent_lines), "Agent", "green")
-            )
+            agent_text = agent_buf.get_text(n=agent_lines)
+            if self._panel_changed("agent", agent_text):
+                self._layout["main"]["agent"].update(
+                    make_panel(agent_text, "Agent", "green")
+                )
 
         # Update cluster panel with health status
         if self._health_poller is not None:
@@ -390,18 +433,39 @@ class TUIDemoController:
             if health:
                 content = self._format_health_panel(health)
                 has_issues = health.get("has_issues", False)
-                self._layout["cluster"].update(
-                    make_cluster_panel(
-                        content,
-                        has_issues=has_issues,
-                        detection_active=False,  # Could parse monitor output for detection
+                if self._panel_changed("cluster", (content, has_issues)):
+                    self._layout["cluster"].update(
+                        make_cluster_panel(
+                            content,
+                            has_issues=has_issues,
+                            detection_active=False,  # Could parse monitor output for detection
+                        )
                     )
-                )
                 # Update workload panel with counter stats
                 workload_content = self._format_workload_panel(health)
-                self._layout["main"]["workload"].update(
-                    make_panel(workload_content, "Workload", "yellow")
-                )
+                if self._panel_changed("workload", workload_content):
+                    self._layout["main"]["workload"].update(
+                        make_panel(workload_content, "Workload", "yellow")
+                    )
+
+    def _panel_changed(self, name: str, inputs: object) -> bool:
+        """
+        Check whether a panel's inputs differ from the last build.
+
+        Records the new inputs when they differ, so the caller can rebuild
+        the panel only on change instead of every 250ms refresh.
+
+        Args:
+            name: Panel name
+            inputs: Everything the panel is built from (must support ==)
+
+        Returns:
+            True if the panel needs rebuilding
+        """
+        if self._panel_inputs.get(name) == inputs:
+            return False
+        self._panel_inputs[name] = inputs
+        return True
 
     def _format_health_panel(self, health: dict[str, Any]) -> str:
         """
@@ -440,9 +504,15 @@ class TUIDemoController:
         """
         lines = ["[bold]TiKV Cluster[/bold]", ""]
 
-        nodes = health.get("nodes", [])
-        tikv_nodes = [n for n in nodes if n.get("type") == "tikv"]
-        pd_nodes = [n for n in nodes if n.get("type") == "pd"]
+        # Split nodes by type in a single pass
+        tikv_nodes: list[dict[str, Any]] = []
+        pd_nodes: list[dict[str, Any]] = []
+        for node in health.get("nodes", []):
+            node_type = node.get("type")
+            if node_type == "tikv":
+                tikv_nodes.append(node)
+            elif node_type == "pd":
+                pd_nodes.append(node)
 
         lines.append("[dim]TiKV Stores:[/dim]")
         for node in tikv_nodes:
@@ -556,14 +626,10 @@ class TUIDemoController:
             key=lambda c: (not c.get("over_limit", False), c.get("key", "")),
         )
 
-        # Count anomalies for header
-        over_limit_count = sum(1 for c in counters if c.get("over_limit"))
-        header = "[bold]Rate Limit Counters[/bold]"
-        if over_limit_count:
-            header += f" [bold red]⚠ {over_limit_count} OVER LIMIT[/bold red]"
-        lines = [header]
-
-        # Show each counter (compact, no blank lines)
+        # Show each counter (compact, no blank lines), counting anomalies
+        # for the header in the same pass
+        lines = [""]
+        over_limit_count = 0
         for counter in sorted_counters:
             key = counter.get("key", "?")
             count = counter.get("count", 0)
@@ -571,6 +637,7 @@ class TUIDemoController:
             is_over = counter.get("over_limit", False)
 
             if is_over:
+                over_limit_count += 1
                 indicator = f"[red]{DOWN_SYMBOL}[/red]"
                 status = f"[bold red]{count}/{limit}[/bold red] (OVER!)"
             elif count > limit * 0.8:
@@ -582,6 +649,11 @@ class TUIDemoController:
 
             lines.append(f"  {indicator} {key}: {status}")
 
+        header = "[bold]Rate Limit Counters[/bold]"
+        if over_limit_count:
+            header += f" [bold red]⚠ {over_limit_count} OVER LIMIT[/bold red]"
+        lines[0] = header
+
         return "\n".join(lines)
 
     def _format_tikv_workload(self, ops_per_sec: float) -> str:
@@ -630,22 +702,22 @@ class TUIDemoController:
             return
 
         try:
-            from python_on_whales import DockerClient
+            from operator_core.deploy import get_docker_client
 
-            docker = DockerClient(compose_files=[self.compose_file])
+            docker = get_docker_client(self.compose_file)
 
             if self.subject_name == "tikv":
                 # Stop YCSB container by name
                 try:
-                    docker.stop("ycsb-run", time=2)
-                    docker.remove("ycsb-run", force=True)
+                    await asyncio.to_thread(docker.stop, "ycsb-run", time=2)
+                    await asyncio.to_thread(docker.remove, "ycsb-run", force=True)
                 except Exception:
                     pass  # Container may not exist
 
             elif self.subject_name == "ratelimiter":
                 # Stop loadgen service
                 try:
-                    docker.compose.stop(["loadgen"])
+                    await asyncio.to_thread(docker.compose.stop, ["loadgen"])
                 except Exception:
                     pass  # Service may not be running
 
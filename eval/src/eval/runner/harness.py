@@ -2,7 +2,9 @@
 
 import asyncio
 import json
+import random
 import sqlite3
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -17,12 +19,31 @@ from eval.variants import get_variant
 
 console = Console()
 
+# Ticket polling backoff: poll quickly at first to catch fast detection,
+# then back off exponentially (with jitter) up to the cap
+POLL_INITIAL_SEC = 0.1
+POLL_MAX_SEC = 2.0
+
 
 def now() -> str:
     """Return current UTC timestamp in ISO8601 format."""
     return datetime.now(timezone.utc).isoformat()
 
 
+def poll_delay(attempt: int, timeout_sec: float) -> float:
+    """Return the jittered backoff delay for a polling attempt.
+
+    Args:
+        attempt: Zero-based poll attempt number
+        timeout_sec: Overall wait timeout; the delay is capped at a tenth of it
+
+    Returns:
+        Seconds to sleep before the next poll
+    """
+    cap = min(POLL_MAX_SEC, timeout_sec / 10)
+    return min(cap, POLL_INITIAL_SEC * 2 ** attempt) * random.uniform(0.8, 1.2)
+
+
 async def extract_commands_from_operator_db(
     operator_db_path: Path,
 ) -> list[dict[str, Any]]:
@@ -70,6 +91,62 @@ async def extract_commands_from_operator_db(
     return await asyncio.to_thread(query_commands)
 
 
+async def latest_ticket_mark(operator_db_path: Path) -> tuple[int, str]:
+    """Return (highest ticket id, newest last_seen_at) from operator.db.
+
+    The mark changes whenever the monitor writes a ticket: a new violation
+    raises the id, and a repeat of an open one advances last_seen_at.
+    Returns (0, "") if there are no tickets yet.
+    """
+    if not operator_db_path.exists():
+        return 0, ""
+
+    def query() -> tuple[int, str]:
+        conn = sqlite3.connect(operator_db_path)
+        try:
+            row = conn.execute("SELECT MAX(id), MAX(last_seen_at) FROM tickets").fetchone()
+            return row[0] or 0, row[1] or ""
+        except sqlite3.OperationalError:
+            # Table doesn't exist yet (monitor still initializing)
+            return 0, ""
+        finally:
+            conn.close()
+
+    return await asyncio.to_thread(query)
+
+
+async def wait_for_ticket_write(
+    operator_db_path: Path,
+    after_mark: tuple[int, str],
+    timeout_sec: float = 15.0,
+) -> bool:
+    """Wait until the monitor creates or bumps a ticket after after_mark.
+
+    Returns as soon as the monitor writes a ticket rather than sleeping for
+    a fixed interval that may be shorter than the monitor's check cadence.
+    A bump of an already-open ticket counts, so chaos that re-triggers an
+    existing violation does not wait out the full timeout.
+
+    Args:
+        operator_db_path: Path to operator.db
+        after_mark: Mark from latest_ticket_mark recorded before chaos
+        timeout_sec: Maximum time to wait
+
+    Returns:
+        True if a ticket was written, False on timeout
+    """
+    start = time.monotonic()
+    attempt = 0
+
+    while (time.monotonic() - start) < timeout_sec:
+        if await latest_ticket_mark(operator_db_path) != after_mark:
+            return True
+        await asyncio.sleep(poll_delay(attempt, timeout_sec))
+        attempt += 1
+
+    return False
+
+
 async def update_ticket_variant(
     operator_db_path: Path,
     variant_config: VariantConfig,
@@ -80,7 +157,8 @@ async def update_ticket_variant(
         conn.execute(
             """
             UPDATE tickets
-            SET variant_model = ?, variant_system_prompt = ?, variant_tools_config = ?
+            SET variant_model = ?, variant_system_prompt = ?, variant_tools_config = ?,
+                updated_at = CURRENT_TIMESTAMP
             WHERE id = (SELECT MAX(id) FROM tickets)
             """,
             (
@@ -101,6 +179,9 @@ async def wait_for_ticket_resolution(
 ) -> tuple[str | None, str | None]:
     """Wait for ticket to be created and resolved in operator.db.
 
+    The database connection is opened once (as soon as the file exists)
+    and reused for every poll rather than reconnecting each time.
+
     Args:
         operator_db_path: Path to operator.db
         timeout_sec: Maximum time to wait
@@ -109,73 +190,84 @@ async def wait_for_ticket_resolution(
     Returns:
         Tuple of (ticket_created_at, resolved_at) or (None, None) if timeout
     """
-    start = asyncio.get_running_loop().time()
+    start = time.monotonic()
     ticket_found = False
+    attempt = 0
+    conn: sqlite3.Connection | None = None
+
+    # Get most recent ticket (optionally filtered by time)
+    if chaos_injected_after:
+        query = """
+            SELECT first_seen_at, resolved_at, status
+            FROM tickets
+            WHERE first_seen_at > ?
+            ORDER BY id DESC
+            LIMIT 1
+        """
+        params: tuple[str, ...] = (chaos_injected_after,)
+    else:
+        query = """
+            SELECT first_seen_at, resolved_at, status
+            FROM tickets
+            ORDER BY id DESC
+            LIMIT 1
+        """
+        params = ()
+
+    def connect() -> sqlite3.Connection:
+        # to_thread may run each poll on a different worker thread; polls
+        # are awaited one at a time so the connection is never shared
+        db = sqlite3.connect(operator_db_path, check_same_thread=False)
+        db.row_factory = sqlite3.Row
+        return db
+
+    def query_ticket() -> tuple[str | None, str | None, str | None]:
+        try:
+            row = conn.execute(query, params).fetchone()
+            if row:
+                return row["first_seen_at"], row["resolved_at"], row["status"]
+            return None, None, None
+        except sqlite3.OperationalError:
+            # Table doesn't exist yet (monitor still initializing)
+            return None, None, None
 
     console.print(f"[dim]Waiting up to {timeout_sec}s for ticket resolution...[/dim]")
 
-    while (asyncio.get_running_loop().time() - start) < timeout_sec:
-        # Wait for database to exist (monitor creates it)
-        if not operator_db_path.exists():
-            elapsed = asyncio.get_running_loop().time() - start
-            if elapsed > 60:
-                console.print("[yellow]Warning: operator.db not created after 60s[/yellow]")
-            await asyncio.sleep(2.0)
-            continue
-
-        def query_ticket():
-            conn = sqlite3.connect(operator_db_path)
-            conn.row_factory = sqlite3.Row
-            try:
-                # Get most recent ticket (optionally filtered by time)
-                if chaos_injected_after:
-                    cursor = conn.execute(
-                        """
-                        SELECT first_seen_at, resolved_at, status
-                        FROM tickets
-                        WHERE first_seen_at > ?
-                        ORDER BY id DESC
-                        LIMIT 1
-                        """,
-                        (chaos_injected_after,),
-                    )
-                else:
-                    cursor = conn.execute(
-                        """
-                        SELECT first_seen_at, resolved_at, status
-                        FROM tickets
-                        ORDER BY id DESC
-                        LIMIT 1
-                        """
-                    )
-                row = cursor.fetchone()
-                if row:
-                    return row["first_seen_at"], row["resolved_at"], row["status"]
-                return None, None, None
-            except sqlite3.OperationalError:
-                # Table doesn't exist yet (monitor still initializing)
-                return None, None, None
-            finally:
-                conn.close()
-
-        created, resolved, status = await asyncio.to_thread(query_ticket)
-
-        if created:
-            # Ticket exists
-            if not ticket_found:
-                ticket_found = True
-                console.print(f"[cyan]Ticket detected (status: {status})[/cyan]")
-
-            if status == "resolved" and resolved:
-                elapsed = asyncio.get_running_loop().time() - start
-                console.print(f"[green]Ticket resolved after {elapsed:.1f}s[/green]")
-                return created, resolved
-            # Ticket not yet resolved, keep waiting
-
-        await asyncio.sleep(2.0)
+    try:
+        while (time.monotonic() - start) < timeout_sec:
+            if conn is None:
+                # Wait for database to exist (monitor creates it)
+                if not operator_db_path.exists():
+                    elapsed = time.monotonic() - start
+                    if elapsed > 60:
+                        console.print("[yellow]Warning: operator.db not created after 60s[/yellow]")
+                    await asyncio.sleep(poll_delay(attempt, timeout_sec))
+                    attempt += 1
+                    continue
+                conn = await asyncio.to_thread(connect)
+
+            created, resolved, status = await asyncio.to_thread(query_ticket)
+
+            if created:
+                # Ticket exists
+                if not ticket_found:
+                    ticket_found = True
+                    console.print(f"[cyan]Ticket detected (status: {status})[/cyan]")
+
+                if status == "resolved" and resolved:
+                    elapsed = time.monotonic() - start
+                    console.print(f"[green]Ticket resolved after {elapsed:.1f}s[/green]")
+                    return created, resolved
+                # Ticket not yet resolved, keep waiting
+
+            await asyncio.sleep(poll_delay(attempt, timeout_sec))
+            attempt += 1
+    finally:
+        if conn is not None:
+            conn.close()
 
     # Timeout - return what we have
-    elapsed = asyncio.get_running_loop().time() - start
+    elapsed = time.monotonic() - start
     console.print(f"[yellow]Timeout after {elapsed:.1f}s (ticket_found={ticket_found})[/yellow]")
     return None, None
 
@@ -226,6 +318,11 @@ async def run_trial(
     console.print("[bold blue]Capturing initial state...[/bold blue]")
     initial_state = await subject.capture_state()
 
+    # Remember the newest ticket write so the chaos ticket can be recognized
+    last_ticket_mark = (0, "")
+    if variant_config and operator_db_path and not baseline:
+        last_ticket_mark = await latest_ticket_mark(operator_db_path)
+
     # Inject chaos (with params if provided)
     console.print(f"[bold yellow]Injecting chaos: {chaos_type}[/bold yellow]")
     chaos_injected_at = now()
@@ -235,8 +332,9 @@ async def run_trial(
     # Write variant config to ticket (if variant and operator_db provided)
     # Do this early so the agent picks it up when it polls
     if variant_config and operator_db_path and not baseline:
-        # Wait briefly for ticket to be created by monitor
-        await asyncio.sleep(2.0)
+        # Wait for the monitor to create (or bump) the ticket for this chaos
+        if not await wait_for_ticket_write(operator_db_path, last_ticket_mark):
+            console.print("[yellow]No ticket write yet; writing variant to latest[/yellow]")
         await update_ticket_variant(operator_db_path, variant_config)
         console.print(f"[dim]Variant config written to ticket: {variant_config.model}[/dim]")
 
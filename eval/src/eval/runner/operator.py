@@ -108,37 +108,61 @@ class OperatorProcesses:
 
         # Start monitor subprocess with fast check interval for eval
         console.print("[bold blue]Starting operator monitor (5s interval)...[/bold blue]")
-        self.monitor_proc = subprocess.Popen(
+        self.monitor_proc = await self._spawn(
+            "monitor",
             [
-                "uv", "run", "operator", "monitor", "run",
+                "monitor", "run",
                 "--subject", self.subject_name,
                 "--db", str(self.operator_db_path),
                 "--interval", "5",  # Fast interval for eval
             ],
-            cwd=self.project_root,
             env=env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
+            startup_sec=3.0,
         )
 
-        # Give monitor time to initialize
-        await asyncio.sleep(3.0)
-
-        if self.monitor_proc.poll() is not None:
-            # Monitor exited early - read output for error
-            stdout, _ = self.monitor_proc.communicate(timeout=1)
-            raise RuntimeError(f"Monitor failed to start: {stdout}")
-
-        console.print(f"[green]Monitor started (PID {self.monitor_proc.pid})[/green]")
-
         # Start agent subprocess
         console.print("[bold blue]Starting operator agent...[/bold blue]")
-        self.agent_proc = subprocess.Popen(
-            [
-                "uv", "run", "operator", "agent", "start",
-                "--db", str(self.operator_db_path),
-            ],
+        try:
+            self.agent_proc = await self._spawn(
+                "agent",
+                ["agent", "start", "--db", str(self.operator_db_path)],
+                env=env,
+                startup_sec=2.0,
+            )
+        except RuntimeError:
+            # Stop monitor before raising
+            await self._stop_process(self.monitor_proc, "monitor")
+            raise
+
+        self._started = True
+
+    async def _spawn(
+        self,
+        name: str,
+        args: list[str],
+        env: dict[str, str],
+        startup_sec: float,
+    ) -> subprocess.Popen:
+        """Start an operator CLI subprocess and check it survives startup.
+
+        Popen blocks through fork/exec, so it runs on a worker thread to
+        keep the event loop responsive.
+
+        Args:
+            name: Process name for messages ("monitor" or "agent")
+            args: Arguments after ``uv run operator``
+            env: Environment for the subprocess
+            startup_sec: Time to give the process to initialize
+
+        Returns:
+            The running process
+
+        Raises:
+            RuntimeError: If the process exits during startup
+        """
+        proc = await asyncio.to_thread(
+            subprocess.Popen,
+            ["uv", "run", "operator", *args],
             cwd=self.project_root,
             env=env,
             stdout=subprocess.PIPE,
@@ -146,21 +170,25 @@ class OperatorProcesses:
             text=True,
         )
 
-        # Give agent time to initialize
-        await asyncio.sleep(2.0)
+        # Give process time to initialize
+        await asyncio.sleep(startup_sec)
 
-        if self.agent_proc.poll() is not None:
-            # Agent exited early - read output for error
-            stdout, _ = self.agent_proc.communicate(timeout=1)
-            # Stop monitor before raising
-            self._stop_process(self.monitor_proc, "monitor")
-            raise RuntimeError(f"Agent failed to start: {stdout}")
+        if proc.poll() is not None:
+            # Exited early - read output for error
+            stdout, _ = proc.communicate(timeout=1)
+            raise RuntimeError(f"{name.capitalize()} failed to start: {stdout}")
 
-        console.print(f"[green]Agent started (PID {self.agent_proc.pid})[/green]")
-        self._started = True
+        console.print(f"[green]{name.capitalize()} started (PID {proc.pid})[/green]")
+        return proc
 
-    def _stop_process(self, proc: Optional[subprocess.Popen], name: str) -> None:
-        """Stop a subprocess gracefully."""
+    async def _stop_process(
+        self, proc: Optional[subprocess.Popen], name: str
+    ) -> None:
+        """Stop a subprocess gracefully.
+
+        Waits for exit in a worker thread so the event loop keeps running
+        during the grace period instead of blocking for up to 5s.
+        """
         if proc is None or proc.poll() is not None:
             return
 
@@ -170,23 +198,23 @@ class OperatorProcesses:
         proc.terminate()
 
         try:
-            proc.wait(timeout=5.0)
+            await asyncio.to_thread(proc.wait, 5.0)
         except subprocess.TimeoutExpired:
             # Force kill if graceful shutdown fails
             console.print(f"[yellow]Force killing {name}...[/yellow]")
             proc.kill()
-            proc.wait(timeout=2.0)
+            await asyncio.to_thread(proc.wait, 2.0)
 
     async def stop(self) -> None:
         """Stop monitor and agent subprocesses."""
         console.print("[bold blue]Stopping operator processes...[/bold blue]")
 
         # Stop agent first (it depends on monitor)
-        self._stop_process(self.agent_proc, "agent")
+        await self._stop_process(self.agent_proc, "agent")
         self.agent_proc = None
 
         # Then stop monitor
-        self._stop_process(self.monitor_proc, "monitor")
+        await self._stop_process(self.monitor_proc, "monitor")
         self.monitor_proc = None
 
         console.print("[green]Operator processes stopped[/green]")
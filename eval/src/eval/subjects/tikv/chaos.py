@@ -1,29 +1,60 @@
 """TiKV chaos injection functions for evaluation harness."""
 
 import asyncio
+import functools
 import logging
 import random
 import re
 import time
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
-from python_on_whales import DockerClient
+from python_on_whales import Container, DockerClient
 
 logger = logging.getLogger(__name__)
 
 # Pattern to match TiKV service containers: {project}-tikv{N}-{index}
 # e.g., tikv-tikv0-1, tikv-eval-1-tikv0-1
 # Avoids matching project prefix (tikv-eval-1-grafana-1 should NOT match)
-TIKV_CONTAINER_PATTERN = re.compile(r"-tikv\d+-")
+TIKV_CONTAINER_PATTERN = re.compile(r"-tikv\d+-", re.IGNORECASE)
 
+T = TypeVar("T")
 
-async def kill_random_tikv(docker: DockerClient) -> dict[str, Any]:
+# Docker CLI calls are subprocess-bound and some (compose up --wait) run
+# for a minute; a dedicated pool keeps them from starving the default
+# executor that the harness uses for its SQLite polls.
+_DOCKER_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="docker-cli")
+
+
+async def run_docker(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking python-on-whales call on the docker thread pool.
+
+    Args:
+        func: DockerClient method to call
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _DOCKER_EXECUTOR, functools.partial(func, *args, **kwargs)
+    )
+
+
+async def kill_random_tikv(
+    docker: DockerClient, containers: list[Container] | None = None
+) -> dict[str, Any]:
     """Kill a random TiKV container with SIGKILL.
 
     Simulates sudden node failure (crash, hardware fault).
 
     Args:
         docker: DockerClient configured with compose file
+        containers: Result of a recent compose.ps() to reuse; listed
+            afresh when omitted
 
     Returns:
         Chaos metadata dict with target_container, signal
@@ -32,26 +63,24 @@ async def kill_random_tikv(docker: DockerClient) -> dict[str, Any]:
         RuntimeError: If no running TiKV containers found
     """
     # Get running containers in thread pool (python-on-whales is sync)
-    containers = await asyncio.to_thread(docker.compose.ps)
+    if containers is None:
+        containers = await run_docker(docker.compose.ps)
 
     # Filter to running TiKV containers (service names: tikv0, tikv1, tikv2)
-    tikv_containers = [
-        c for c in containers
-        if TIKV_CONTAINER_PATTERN.search(c.name.lower()) and c.state.running
-    ]
+    tikv_names = await running_tikv_names(docker, containers)
 
-    if not tikv_containers:
+    if not tikv_names:
         raise RuntimeError("No running TiKV containers to kill")
 
     # Random selection
-    target = random.choice(tikv_containers)
+    target = random.choice(tikv_names)
 
     # Kill with SIGKILL in thread pool
-    await asyncio.to_thread(docker.kill, target.name)
+    await run_docker(docker.kill, target)
 
     return {
         "chaos_type": "node_kill",
-        "target_container": target.name,
+        "target_container": target,
         "signal": "SIGKILL",
     }
 
@@ -76,7 +105,7 @@ async def inject_latency_chaos(
 
     # Inject latency on eth0 using tc netem
     cmd = f"tc qdisc add dev eth0 root netem delay {avg_ms}ms {variation_ms}ms"
-    await asyncio.to_thread(docker.execute, target_container, ["sh", "-c", cmd])
+    await run_docker(docker.execute, target_container, ["sh", "-c", cmd])
 
     return {
         "chaos_type": "latency",
@@ -96,7 +125,7 @@ async def cleanup_latency_chaos(docker: DockerClient, target_container: str) ->
     """
     try:
         cmd = "tc qdisc del dev eth0 root"
-        await asyncio.to_thread(docker.execute, target_container, ["sh", "-c", cmd])
+        await run_docker(docker.execute, target_container, ["sh", "-c", cmd])
     except Exception as e:
         # Container may have restarted or rule doesn't exist
         logger.debug(f"Failed to cleanup latency chaos on {target_container}: {e}")
@@ -127,7 +156,7 @@ async def inject_disk_pressure(
 
     # Get available space in KB
     df_cmd = f"df --output=avail {target_path} | tail -n 1"
-    result = await asyncio.to_thread(
+    result = await run_docker(
         docker.execute, target_container, ["sh", "-c", df_cmd]
     )
     avail_kb = int(result.strip())
@@ -139,7 +168,7 @@ async def inject_disk_pressure(
     timestamp = int(time.time())
     fill_file = f"{target_path}/chaos-fill-{timestamp}.tmp"
     fallocate_cmd = f"fallocate -l {fill_bytes} {fill_file}"
-    await asyncio.to_thread(
+    await run_docker(
         docker.execute, target_container, ["sh", "-c", fallocate_cmd]
     )
 
@@ -164,7 +193,7 @@ async def cleanup_disk_pressure(
     """
     try:
         cmd = f"rm -f {fill_file}"
-        await asyncio.to_thread(docker.execute, target_container, ["sh", "-c", cmd])
+        await run_docker(docker.execute, target_container, ["sh", "-c", cmd])
     except Exception as e:
         # Container may have restarted or file doesn't exist
         logger.debug(f"Failed to cleanup disk pressure on {target_container}: {e}")
@@ -183,15 +212,16 @@ async def inject_network_partition(
     Returns:
         Chaos metadata dict with isolated_container, target_ips
     """
-    # Block outbound and inbound traffic for each target IP
+    # Block outbound and inbound traffic for each target IP, all rules in
+    # one exec (each exec spawns the docker CLI); && stops at the first
+    # failure like running them one by one did
+    rules = []
     for ip in target_ips:
-        output_cmd = f"iptables -I OUTPUT -d {ip} -j DROP"
-        input_cmd = f"iptables -I INPUT -s {ip} -j DROP"
-        await asyncio.to_thread(
-            docker.execute, isolated_container, ["sh", "-c", output_cmd]
-        )
-        await asyncio.to_thread(
-            docker.execute, isolated_container, ["sh", "-c", input_cmd]
+        rules.append(f"iptables -I OUTPUT -d {ip} -j DROP")
+        rules.append(f"iptables -I INPUT -s {ip} -j DROP")
+    if rules:
+        await run_docker(
+            docker.execute, isolated_container, ["sh", "-c", " && ".join(rules)]
         )
 
     return {
@@ -211,56 +241,139 @@ async def cleanup_network_partition(
         isolated_container: Container to restore connectivity
         target_ips: List of peer IPs to unblock
     """
+    # Delete every rule in one exec; each delete tolerates a missing rule
+    rules = []
     for ip in target_ips:
-        try:
-            output_cmd = f"iptables -D OUTPUT -d {ip} -j DROP || true"
-            input_cmd = f"iptables -D INPUT -s {ip} -j DROP || true"
-            await asyncio.to_thread(
-                docker.execute, isolated_container, ["sh", "-c", output_cmd]
-            )
-            await asyncio.to_thread(
-                docker.execute, isolated_container, ["sh", "-c", input_cmd]
-            )
-        except Exception as e:
-            # Container may have restarted or rules don't exist
-            logger.debug(
-                f"Failed to cleanup network partition on {isolated_container} for {ip}: {e}"
-            )
+        rules.append(f"iptables -D OUTPUT -d {ip} -j DROP || true")
+        rules.append(f"iptables -D INPUT -s {ip} -j DROP || true")
+    if not rules:
+        return
+    try:
+        await run_docker(
+            docker.execute, isolated_container, ["sh", "-c", "; ".join(rules)]
+        )
+    except Exception as e:
+        # Container may have restarted or been removed
+        logger.debug(
+            f"Failed to cleanup network partition on {isolated_container}: {e}"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ContainerSnapshot:
+    """Container fields read together from one inspect.
+
+    python-on-whales caches an inspect result for only a few milliseconds
+    and re-runs the docker CLI on later attribute reads, so the fields
+    needed here are copied out right after the inspect.
+    """
+
+    name: str
+    running: bool
+    health: str | None  # None when the container has no healthcheck
+    ip_address: str | None  # IP on the container's first network
+
+
+def _snapshot(container: Container) -> ContainerSnapshot:
+    """Copy the fields used for chaos targeting out of a fresh inspect."""
+    state = container.state
+    networks = container.network_settings.networks or {}
+    first_network = next(iter(networks.values()), None)
+    return ContainerSnapshot(
+        name=container.name,
+        running=bool(state.running),
+        health=state.health.status if state.health else None,
+        ip_address=first_network.ip_address if first_network else None,
+    )
+
+
+def _inspect_many(
+    docker: DockerClient, containers: list[Container]
+) -> list[ContainerSnapshot]:
+    """Inspect containers once each and snapshot the fields used here.
+
+    Each container is inspected through docker.container.inspect and read
+    immediately, while the result is still cached, so reading name, state
+    and networks costs one docker CLI call per container instead of one
+    per attribute.
+
+    Args:
+        docker: DockerClient configured with compose file
+        containers: Containers to inspect (IDs are read without a reload)
+
+    Returns:
+        Snapshots in the same order as containers
+    """
+    return [_snapshot(docker.container.inspect(str(c))) for c in containers]
+
+
+async def inspect_containers(
+    docker: DockerClient, containers: list[Container]
+) -> list[ContainerSnapshot]:
+    """Inspect containers on the docker pool and snapshot their state.
+
+    Args:
+        docker: DockerClient configured with compose file
+        containers: Containers to inspect (e.g. from compose.ps())
+
+    Returns:
+        Snapshots in the same order as containers
+    """
+    return await run_docker(_inspect_many, docker, containers)
+
+
+def _is_running_tikv(data: ContainerSnapshot) -> bool:
+    """Check whether a snapshot describes a running TiKV service container."""
+    return bool(TIKV_CONTAINER_PATTERN.search(data.name) and data.running)
+
+
+async def running_tikv_names(
+    docker: DockerClient, containers: list[Container]
+) -> list[str]:
+    """Get names of running TiKV containers from a compose ps listing.
+
+    Name and state come from one snapshot per container rather than
+    from the lazy Container attributes, each of which may re-run the
+    docker CLI.
+
+    Args:
+        docker: DockerClient configured with compose file
+        containers: Result of compose.ps()
+
+    Returns:
+        Container names of running TiKV stores
+    """
+    inspected = await inspect_containers(docker, containers)
+    return [data.name for data in inspected if _is_running_tikv(data)]
 
 
 async def get_tikv_peer_ips(
-    docker: DockerClient, exclude_container: str
+    docker: DockerClient,
+    exclude_container: str,
+    containers: list[Container] | None = None,
 ) -> list[str]:
     """Get IP addresses of TiKV peer containers.
 
     Args:
         docker: DockerClient configured with compose file
         exclude_container: Container name to exclude from results
+        containers: Result of a recent compose.ps() to reuse; listed
+            afresh when omitted
 
     Returns:
         List of IP addresses for TiKV peers (excluding specified container)
     """
-    containers = await asyncio.to_thread(docker.compose.ps)
-
-    # Filter to running TiKV containers, excluding the specified one
-    tikv_peers = [
-        c
-        for c in containers
-        if TIKV_CONTAINER_PATTERN.search(c.name.lower())
-        and c.state.running
-        and c.name != exclude_container
+    if containers is None:
+        containers = await run_docker(docker.compose.ps)
+
+    # One inspect per container instead of one per attribute access
+    inspected = await inspect_containers(docker, containers)
+
+    # Running TiKV peers (excluding the specified one) with a network IP
+    return [
+        data.ip_address
+        for data in inspected
+        if _is_running_tikv(data)
+        and data.name != exclude_container
+        and data.ip_address
     ]
-
-    # Get IP addresses from container inspect
-    peer_ips = []
-    for container in tikv_peers:
-        inspect_data = await asyncio.to_thread(docker.inspect, container.name)
-        # Extract IP from default bridge network
-        networks = inspect_data.network_settings.networks
-        if networks:
-            # Get first network's IP
-            ip = next(iter(networks.values())).ip_address
-            if ip:
-                peer_ips.append(ip)
-
-    return peer_ips
@@ -4,16 +4,17 @@ import asyncio
 import logging
 import os
 import random
+import re
+import time
 from pathlib import Path
 from typing import Any
 
 import httpx
-from python_on_whales import DockerClient
+from python_on_whales import Container, DockerClient
 
 logger = logging.getLogger(__name__)
 
 from eval.subjects.tikv.chaos import (
-    TIKV_CONTAINER_PATTERN,
     cleanup_disk_pressure,
     cleanup_latency_chaos,
     cleanup_network_partition,
@@ -21,7 +22,10 @@ from eval.subjects.tikv.chaos import (
     inject_disk_pressure,
     inject_latency_chaos,
     inject_network_partition,
+    inspect_containers,
     kill_random_tikv,
+    run_docker,
+    running_tikv_names,
 )
 
 
@@ -35,6 +39,9 @@ BASE_PROM_PORT = 9090
 BASE_GRAFANA_PORT = 3000
 PORT_INCREMENT = 10000
 
+# PD and TiKV containers checked by wait_healthy (any case, anywhere in name)
+CLUSTER_CONTAINER_PATTERN = re.compile(r"pd|tikv", re.IGNORECASE)
+
 
 class TiKVEvalSubject:
     """TiKV cluster evaluation subject.
@@ -102,17 +109,40 @@ class TiKVEvalSubject:
         # PD API endpoint (host port)
         self.pd_endpoint = f"http://localhost:{self.pd_port}"
 
+        # (fetched_at, containers) from the last compose ps
+        self._ps_cache: tuple[float, list[Container]] | None = None
+
+    async def _compose_ps(self, max_age: float = 2.0) -> list[Container]:
+        """List compose containers, reusing a listing younger than max_age.
+
+        compose ps only yields container IDs (state is inspected lazily),
+        so a recent listing stays valid until the containers are recreated.
+
+        Args:
+            max_age: Maximum age in seconds of a cached listing to reuse
+        """
+        now = time.monotonic()
+        if self._ps_cache is not None and now - self._ps_cache[0] < max_age:
+            return self._ps_cache[1]
+
+        containers = await run_docker(self.docker.compose.ps)
+        self._ps_cache = (now, containers)
+        return containers
+
     async def reset(self) -> None:
         """Reset TiKV cluster via docker-compose down/up with volume wipe."""
+        # Containers are recreated, so any cached listing is stale
+        self._ps_cache = None
+
         # Down with volume cleanup (removes all data)
-        await asyncio.to_thread(
+        await run_docker(
             self.docker.compose.down,
             volumes=True,
             remove_orphans=True,
         )
 
         # Up and wait for healthchecks
-        await asyncio.to_thread(
+        await run_docker(
             self.docker.compose.up,
             detach=True,
             wait=True,
@@ -122,36 +152,39 @@ class TiKVEvalSubject:
         """Wait for all TiKV + PD containers to be healthy.
 
         Checks both Docker healthcheck status AND PD API for store count.
+        One PD client is shared by every poll so the keep-alive connection
+        is reused instead of reconnecting every 2s.
         """
-        start = asyncio.get_running_loop().time()
-
-        while (asyncio.get_running_loop().time() - start) < timeout_sec:
-            try:
-                # Check container health in thread pool
-                containers = await asyncio.to_thread(self.docker.compose.ps)
-
-                # Filter to PD + TiKV containers
-                cluster_containers = [
-                    c
-                    for c in containers
-                    if ("pd" in c.name.lower() or "tikv" in c.name.lower())
-                ]
-
-                # All containers must be running with healthy status
-                all_healthy = all(
-                    c.state.running and c.state.health in ("healthy", None)
-                    for c in cluster_containers
-                )
+        start = time.monotonic()
 
-                if all_healthy:
-                    # Additional verification: PD reports 3 stores
-                    if await self._verify_stores_up():
-                        return True
+        async with httpx.AsyncClient(base_url=self.pd_endpoint, timeout=5.0) as client:
+            while (time.monotonic() - start) < timeout_sec:
+                try:
+                    # Check container health in thread pool
+                    # Always refresh; the listing seeds the cache for inject_chaos
+                    containers = await self._compose_ps(max_age=0)
 
-            except Exception:
-                pass  # Container not ready yet
+                    inspected = await inspect_containers(self.docker, containers)
 
-            await asyncio.sleep(2.0)
+                    # Single pass: every PD + TiKV container must be running
+                    # with healthy status (None without a healthcheck)
+                    all_healthy = True
+                    for data in inspected:
+                        if not CLUSTER_CONTAINER_PATTERN.search(data.name):
+                            continue
+                        if not data.running or data.health not in ("healthy", None):
+                            all_healthy = False
+                            break
+
+                    if all_healthy:
+                        # Additional verification: PD reports 3 stores
+                        if await self._verify_stores_up(client):
+                            return True
+
+                except Exception:
+                    pass  # Container not ready yet
+
+                await asyncio.sleep(2.0)
 
         return False
 
@@ -206,33 +239,35 @@ class TiKVEvalSubject:
         Raises:
             ValueError: If chaos_type not supported
         """
+        # Usually reuses the listing from the wait_healthy that preceded us
+        containers = await self._compose_ps()
+
         if chaos_type == "node_kill":
-            return await kill_random_tikv(self.docker)
+            return await kill_random_tikv(self.docker, containers=containers)
 
         # Get a random running TiKV container for other chaos types
-        containers = await asyncio.to_thread(self.docker.compose.ps)
-        tikv_containers = [
-            c for c in containers
-            if TIKV_CONTAINER_PATTERN.search(c.name.lower()) and c.state.running
-        ]
+        tikv_names = await running_tikv_names(self.docker, containers)
 
-        if not tikv_containers:
+        if not tikv_names:
             raise RuntimeError("No running TiKV containers for chaos injection")
 
-        target = random.choice(tikv_containers)
+        target = random.choice(tikv_names)
 
         if chaos_type == "latency":
             min_ms = params.get("min_ms", 50)
             max_ms = params.get("max_ms", 150)
-            return await inject_latency_chaos(self.docker, target.name, min_ms, max_ms)
+            return await inject_latency_chaos(self.docker, target, min_ms, max_ms)
 
         elif chaos_type == "disk_pressure":
             fill_percent = params.get("fill_percent", 80)
-            return await inject_disk_pressure(self.docker, target.name, fill_percent)
+            return await inject_disk_pressure(self.docker, target, fill_percent)
 
         elif chaos_type == "network_partition":
-            peer_ips = await get_tikv_peer_ips(self.docker, target.name)
-            return await inject_network_partition(self.docker, target.name, peer_ips)
+            # Reuse the listing above rather than spawning a second compose ps
+            peer_ips = await get_tikv_peer_ips(
+                self.docker, target, containers=containers
+            )
+            return await inject_network_partition(self.docker, target, peer_ips)
 
         raise ValueError(
             f"Unknown chaos type: {chaos_type}. Supported: {self.get_chaos_types()}"
@@ -274,20 +309,23 @@ class TiKVEvalSubject:
             # Handle gracefully - container may have been restarted/killed
             logger.warning(f"Failed to cleanup chaos {chaos_type}: {e}")
 
-    async def _verify_stores_up(self) -> bool:
-        """Verify PD reports 3 TiKV stores in Up state."""
+    async def _verify_stores_up(self, client: httpx.AsyncClient) -> bool:
+        """Verify PD reports 3 TiKV stores in Up state.
+
+        Args:
+            client: httpx client with base_url set to the PD endpoint
+        """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get(f"{self.pd_endpoint}/pd/api/v1/stores")
-                data = resp.json()
+            resp = await client.get("/pd/api/v1/stores")
+            data = resp.json()
 
-                stores = data.get("stores", [])
-                up_stores = [
-                    s
-                    for s in stores
-                    if s.get("store", {}).get("state_name") == "Up"
-                ]
+            stores = data.get("stores", [])
+            up_stores = [
+                s
+                for s in stores
+                if s.get("store", {}).get("state_name") == "Up"
+            ]
 
-                return len(up_stores) >= 3
+            return len(up_stores) >= 3
         except Exception:
             return False
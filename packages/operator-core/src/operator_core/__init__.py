@@ -13,14 +13,9 @@ This package provides the foundational components including:
 
 __version__ = "0.1.0"
 
+from typing import TYPE_CHECKING
+
 # Re-export public types for convenient imports
-from operator_core.deploy import (
-    DeploymentStatus,
-    DeploymentTarget,
-    LocalDeployment,
-    ServiceStatus,
-    create_local_deployment,
-)
 from operator_core.types import (
     ClusterMetrics,
     Store,
@@ -30,6 +25,40 @@ from operator_core.types import (
 # Re-export InvariantViolation from operator_protocols for convenience
 from operator_protocols import InvariantViolation
 
+# Deployment symbols resolve on first access: operator_core.deploy pulls in
+# python_on_whales, which most importers (monitor, agent, tickets) never use
+_DEPLOY_EXPORTS = frozenset(
+    {
+        "DeploymentStatus",
+        "DeploymentTarget",
+        "LocalDeployment",
+        "ServiceStatus",
+        "create_local_deployment",
+        "get_docker_client",
+    }
+)
+
+if TYPE_CHECKING:
+    # Let type checkers and IDEs resolve the lazily exported names
+    from operator_core.deploy import (
+        DeploymentStatus,
+        DeploymentTarget,
+        LocalDeployment,
+        ServiceStatus,
+        create_local_deployment,
+        get_docker_client,
+    )
+
+
+def __getattr__(name: str):
+    """Lazy import for deployment symbols to keep package import light."""
+    if name in _DEPLOY_EXPORTS:
+        from operator_core import deploy
+
+        return getattr(deploy, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "__version__",
     # Data Types (re-exported from operator_protocols)
@@ -45,4 +74,5 @@ __all__ = [
     "ServiceStatus",
     "DeploymentStatus",
     "create_local_deployment",
+    "get_docker_client",
 ]
@@ -1,12 +1,11 @@
 """Ticket database operations for agent loop."""
 
-import json
 import sqlite3
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from operator_core.monitor.types import Ticket, TicketStatus
+from operator_core.db.tickets import SQL_RESOLVED_AT
+from operator_core.monitor.types import TICKET_COLUMNS, Ticket
 
 
 class TicketOpsDB:
@@ -57,36 +56,15 @@ class TicketOpsDB:
             First open ticket, or None if no open tickets
         """
         cursor = self._conn.execute(
-            "SELECT * FROM tickets WHERE status = 'open' ORDER BY created_at ASC LIMIT 1"
+            f"SELECT {', '.join(TICKET_COLUMNS)} FROM tickets "
+            "WHERE status = 'open' ORDER BY created_at ASC LIMIT 1"
         )
         row = cursor.fetchone()
 
         if not row:
             return None
 
-        return Ticket(
-            id=row["id"],
-            violation_key=row["violation_key"],
-            invariant_name=row["invariant_name"],
-            message=row["message"],
-            severity=row["severity"],
-            first_seen_at=datetime.fromisoformat(row["first_seen_at"]),
-            last_seen_at=datetime.fromisoformat(row["last_seen_at"]),
-            status=TicketStatus(row["status"]),
-            store_id=row["store_id"],
-            held=bool(row["held"]),
-            batch_key=row["batch_key"],
-            occurrence_count=row["occurrence_count"],
-            resolved_at=datetime.fromisoformat(row["resolved_at"]) if row["resolved_at"] else None,
-            diagnosis=row["diagnosis"],
-            metric_snapshot=json.loads(row["metric_snapshot"]) if row["metric_snapshot"] else None,
-            subject_context=row["subject_context"],
-            variant_model=row["variant_model"],
-            variant_system_prompt=row["variant_system_prompt"],
-            variant_tools_config=row["variant_tools_config"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-        )
+        return Ticket.from_row(row)
 
     def update_ticket_resolved(self, ticket_id: int, summary: str) -> None:
         """Mark ticket as resolved.
@@ -96,8 +74,9 @@ class TicketOpsDB:
             summary: Resolution summary
         """
         self._conn.execute(
-            "UPDATE tickets SET status = 'resolved', resolved_at = ?, diagnosis = ? WHERE id = ?",
-            (datetime.now().isoformat(), summary, ticket_id),
+            f"UPDATE tickets SET status = 'resolved', resolved_at = {SQL_RESOLVED_AT}, "
+            "diagnosis = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            (summary, ticket_id),
         )
         self._conn.commit()
 
@@ -109,7 +88,8 @@ class TicketOpsDB:
             reason: Escalation reason
         """
         self._conn.execute(
-            "UPDATE tickets SET status = 'diagnosed', diagnosis = ? WHERE id = ?",
+            "UPDATE tickets SET status = 'diagnosed', diagnosis = ?, "
+            "updated_at = CURRENT_TIMESTAMP WHERE id = ?",
             (f"ESCALATED: {reason}", ticket_id),
         )
         self._conn.commit()
@@ -121,7 +101,8 @@ class TicketOpsDB:
             ticket_id: ID of ticket to hold
         """
         self._conn.execute(
-            "UPDATE tickets SET held = 1, status = 'acknowledged' WHERE id = ?",
+            "UPDATE tickets SET held = 1, status = 'acknowledged', "
+            "updated_at = CURRENT_TIMESTAMP WHERE id = ?",
             (ticket_id,),
         )
         self._conn.commit()
@@ -133,7 +114,7 @@ class TicketOpsDB:
             ticket_id: ID of ticket to unhold
         """
         self._conn.execute(
-            "UPDATE tickets SET held = 0 WHERE id = ?",
+            "UPDATE tickets SET held = 0, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
             (ticket_id,),
         )
         self._conn.commit()
@@ -1,15 +1,33 @@
 """Shell tool for agent with @beta_tool decorator."""
 
 import subprocess
+from typing import TypedDict
 
 from anthropic import beta_tool
 
+# Cap on bytes of each output stream kept from a command. Output is sent to
+# the model and stored in the audit log, so an unbounded `cat` or `docker
+# logs` would bloat both. The budget is generous so normal diagnostics pass
+# through untouched; when it is exceeded the tail is kept, since that is
+# where the latest log lines and error messages end up.
+MAX_OUTPUT_BYTES = 4 * 1024 * 1024
+
+
+class ShellResult(TypedDict):
+    """Outcome of one shell tool call, as recorded in the audit log."""
+
+    output: str
+    exit_code: int
+    command: str
+    reasoning: str
+
+
 # Global state for capturing shell execution results.
 # Needed because tool_runner doesn't yield results separately.
-_last_shell_result: dict | None = None
+_last_shell_result: ShellResult | None = None
 
 
-def get_last_result() -> dict | None:
+def get_last_result() -> ShellResult | None:
     """Get and clear the last shell result."""
     global _last_shell_result
     result = _last_shell_result
@@ -17,6 +35,24 @@ def get_last_result() -> dict | None:
     return result
 
 
+def _decode(data: bytes, limit: int = MAX_OUTPUT_BYTES) -> str:
+    """Decode the last limit bytes of output, noting how much was dropped.
+
+    Output is captured as bytes and only the kept tail is decoded, so an
+    oversized or unused stream is never turned into a full str.
+    """
+    if not data:
+        return ""
+    if len(data) <= limit:
+        return data.decode("utf-8", errors="replace")
+    start = len(data) - limit
+    # Skip UTF-8 continuation bytes of a character split by the cut
+    while start < len(data) and data[start] & 0xC0 == 0x80:
+        start += 1
+    kept = data[start:].decode("utf-8", errors="replace")
+    return f"... [truncated {start} bytes]\n{kept}"
+
+
 @beta_tool
 def shell(command: str, reasoning: str) -> str:
     """Execute a shell command.
@@ -26,7 +62,8 @@ def shell(command: str, reasoning: str) -> str:
         reasoning: Why this command is being run (for audit trail)
 
     Returns:
-        Command output (stdout, or stdout+stderr on non-zero exit)
+        Command output (stdout, or stdout+stderr on non-zero exit), each
+        stream capped at MAX_OUTPUT_BYTES
     """
     global _last_shell_result
     try:
@@ -35,12 +72,13 @@ def shell(command: str, reasoning: str) -> str:
             shell=True,
             capture_output=True,
             timeout=120,
-            text=True,
         )
-        output = result.stdout
+        output = _decode(result.stdout)
         exit_code = result.returncode
         if exit_code != 0:
-            output += f"\n\nSTDERR: {result.stderr}\nExit code: {exit_code}"
+            # stderr is only reported on failure, so only decode it then
+            stderr = _decode(result.stderr)
+            output += f"\n\nSTDERR: {stderr}\nExit code: {exit_code}"
         _last_shell_result = {
             "output": output,
             "exit_code": exit_code,
@@ -4,8 +4,6 @@ from pathlib import Path
 
 import typer
 
-from operator_core.agent_lab import run_agent_loop
-
 agent_app = typer.Typer(help="Run the AI agent")
 DEFAULT_DB_PATH = Path.home() / ".operator" / "tickets.db"
 
@@ -15,4 +13,8 @@ def start_agent(
     db_path: Path = typer.Option(DEFAULT_DB_PATH, "--db", help="Path to tickets database"),
 ) -> None:
     """Run the agent loop. Polls for tickets and processes with Claude."""
+    # Deferred: the anthropic SDK takes ~1s to import, which every other
+    # operator subcommand would otherwise pay at startup
+    from operator_core.agent_lab import run_agent_loop
+
     run_agent_loop(db_path)
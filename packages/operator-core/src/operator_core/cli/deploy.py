@@ -1,12 +1,13 @@
 """Deploy commands for managing cluster deployments."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from operator_core.deploy import LocalDeployment, create_local_deployment
+if TYPE_CHECKING:
+    from operator_core.deploy import LocalDeployment
 
 deploy_app = typer.Typer(help="Deployment commands")
 local_app = typer.Typer(help="Local Docker Compose deployment")
@@ -15,8 +16,11 @@ deploy_app.add_typer(local_app, name="local")
 console = Console()
 
 
-def _get_deployment(subject: str) -> LocalDeployment:
+def _get_deployment(subject: str) -> "LocalDeployment":
     """Get a LocalDeployment for the given subject."""
+    # Deferred so other CLI commands don't pay for importing python_on_whales
+    from operator_core.deploy import create_local_deployment
+
     try:
         return create_local_deployment(subject)
     except FileNotFoundError as e:
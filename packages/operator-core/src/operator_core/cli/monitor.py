@@ -10,7 +10,11 @@ Per RESEARCH.md patterns:
 """
 
 import asyncio
+import logging
 import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 import typer
@@ -23,6 +27,54 @@ monitor_app = typer.Typer(help="Run the operator monitor daemon")
 # Default database path
 DEFAULT_DB_PATH = Path.home() / ".operator" / "tickets.db"
 
+# Cap on log records waiting for the stdout thread; beyond it (stdout not
+# being drained) new records are dropped instead of growing memory
+MAX_QUEUED_LOG_RECORDS = 10_000
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records when its bounded queue is full."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def _start_log_listener() -> QueueListener:
+    """
+    Route monitor log records to stdout/stderr from a background thread.
+
+    The event loop only enqueues records, so a slow terminal or a full
+    pipe (e.g. a parent that doesn't read our output) can't stall a check
+    cycle. The queue is bounded by MAX_QUEUED_LOG_RECORDS and records are
+    dropped while it is full. Messages are written bare, matching the
+    previous print output: status lines go to stdout, while warnings and
+    errors (including cycle-failure tracebacks) go to stderr.
+
+    Returns:
+        Started QueueListener; call stop() to flush and shut it down
+    """
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(
+        maxsize=MAX_QUEUED_LOG_RECORDS
+    )
+    monitor_logger = logging.getLogger("operator_core.monitor")
+    monitor_logger.addHandler(_DroppingQueueHandler(log_queue))
+    monitor_logger.setLevel(logging.INFO)
+    monitor_logger.propagate = False
+
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.addFilter(lambda record: record.levelno < logging.WARNING)
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setLevel(logging.WARNING)
+
+    listener = QueueListener(
+        log_queue, stdout_handler, stderr_handler, respect_handler_level=True
+    )
+    listener.start()
+    return listener
+
 
 @monitor_app.command("run")
 def run_monitor(
@@ -139,4 +191,8 @@ def run_monitor(
             print(f"Error: {e}")
             raise typer.Exit(1)
 
-    asyncio.run(_run())
+    listener = _start_log_listener()
+    try:
+        asyncio.run(_run())
+    finally:
+        listener.stop()
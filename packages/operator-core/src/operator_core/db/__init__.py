@@ -3,8 +3,9 @@ Database module for ticket persistence.
 
 Exports:
     TicketDB: Async context manager for ticket database operations
+    TicketDBPool: Shared, reference-counted ticket database connections
 """
 
-from operator_core.db.tickets import TicketDB
+from operator_core.db.tickets import TicketDB, TicketDBPool
 
-__all__ = ["TicketDB"]
+__all__ = ["TicketDB", "TicketDBPool"]
@@ -43,16 +43,13 @@ CREATE TABLE IF NOT EXISTS tickets (
 CREATE INDEX IF NOT EXISTS idx_tickets_open_violation
 ON tickets(violation_key) WHERE status != 'resolved';
 
--- Index for flap detection (recent tickets for same violation)
-CREATE INDEX IF NOT EXISTS idx_tickets_violation_time
-ON tickets(violation_key, resolved_at);
+-- No query filters on (violation_key, resolved_at); drop the unused index
+-- older databases were created with so writes skip its B-tree maintenance
+DROP INDEX IF EXISTS idx_tickets_violation_time;
 
--- Trigger to update updated_at on modification
-CREATE TRIGGER IF NOT EXISTS tickets_updated_at
-AFTER UPDATE ON tickets
-BEGIN
-    UPDATE tickets SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
-END;
+-- updated_at is set inline by every UPDATE statement; drop the trigger
+-- older databases were created with (it doubled writes per UPDATE)
+DROP TRIGGER IF EXISTS tickets_updated_at;
 """
 
 AGENT_SCHEMA_SQL = """
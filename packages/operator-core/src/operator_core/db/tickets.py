@@ -2,33 +2,209 @@
 SQLite-based ticket persistence.
 
 This module provides async database operations for ticket management:
-- Create or update tickets (with deduplication)
+- Create or update tickets (with deduplication), singly or in batches
 - Query tickets by status
 - Resolve/hold/unhold tickets
 - Auto-resolve cleared violations
 
 Per RESEARCH.md patterns:
 - Use async context manager for connection lifecycle
-- Use transactions for atomicity in create_or_update
+- Share one long-lived connection per database file (TicketDBPool) so the
+  page cache stays warm across TicketDB handles
+- Run stdlib sqlite3 on one dedicated thread per connection; each method
+  is a single executor submit rather than aiosqlite's per-call queue hops
+- Use transactions for atomicity in create_or_update (one per batch)
 - Respect held flag in auto-resolve
 """
 
+import asyncio
 import json
+import sqlite3
+import threading
+from collections import namedtuple
+from collections.abc import Callable, Collection, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
-import aiosqlite
+from typing import Any, TypeVar
 
 from operator_core.db.schema import SCHEMA_SQL
-from operator_core.monitor.types import Ticket, TicketStatus, make_violation_key
+from operator_core.monitor.types import (
+    TICKET_COLUMNS,
+    Ticket,
+    TicketStatus,
+    make_violation_key,
+)
 from operator_protocols import InvariantViolation
 
+# Page cache size in KiB (negative value per SQLite PRAGMA cache_size docs)
+CACHE_SIZE_KIB = 64 * 1024
+
+# SQL expression for resolved_at, generated inside the statement instead of
+# in Python. resolved_at is compared against first_seen_at, which is local
+# time, so it uses the local clock in datetime.isoformat() layout.
+# updated_at uses CURRENT_TIMESTAMP (UTC) to match its INSERT default.
+SQL_RESOLVED_AT = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+
+# Explicit column list so rows match Ticket.from_row's positional order
+COLUMNS_SQL = ", ".join(TICKET_COLUMNS)
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=32)
+def _row_type(description: tuple) -> type:
+    """Build (once per distinct cursor.description) a namedtuple row type."""
+    return namedtuple("TicketRow", [d[0] for d in description], rename=True)
+
+
+def _namedtuple_factory(cursor: Any, row: tuple) -> tuple:
+    """
+    Row factory producing namedtuples keyed by cursor.description.
+
+    Attribute access on a namedtuple is an offset lookup, unlike
+    sqlite3.Row which searches column names on every key access.
+    """
+    return _row_type(cursor.description)(*row)
+
+
+class TicketDBPool:
+    """
+    Reference-counted registry of shared ticket database connections.
+
+    SQLite's page cache is per-connection, so opening a fresh connection for
+    every TicketDB block re-reads the schema and re-warms the cache from disk.
+    The pool keeps one connection per database file open for as long as any
+    handle borrows it (the monitor daemon holds one for its whole lifetime).
+
+    Each connection is owned by a single-worker executor: it is opened, used
+    and closed on that thread only, which serializes access without locks.
+
+    The registry itself is guarded by a threading.Lock rather than an
+    asyncio.Lock: the bookkeeping never awaits, and an asyncio.Lock would
+    bind to the first event loop that waits on it, breaking later callers
+    running under another loop (asyncio.run, per-test loops). Opens are
+    tracked as concurrent futures, which are not tied to a loop either, so
+    handles racing to borrow a file share a single open.
+
+    When the last handle is released the connection is closed after running
+    PRAGMA optimize (refreshes planner statistics) and a TRUNCATE checkpoint
+    (bounds WAL growth).
+    """
+
+    def __init__(self) -> None:
+        self._connections: dict[
+            Path, tuple[Future[sqlite3.Connection], ThreadPoolExecutor]
+        ] = {}
+        self._refcounts: dict[Path, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(db_path: Path) -> Path:
+        return Path(db_path).resolve()
+
+    @staticmethod
+    def _open(db_path: Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = _namedtuple_factory
+        conn.execute("PRAGMA journal_mode = WAL")
+        # In WAL mode NORMAL only fsyncs at checkpoints, not on every commit
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+        conn.executescript(SCHEMA_SQL)
+        conn.commit()
+        return conn
+
+    @staticmethod
+    def _close(conn: sqlite3.Connection) -> None:
+        try:
+            conn.execute("PRAGMA optimize")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+
+    @classmethod
+    def _discard(cls, opening: Future[sqlite3.Connection]) -> None:
+        if opening.cancelled() or opening.exception() is not None:
+            return
+        cls._close(opening.result())
+
+    async def acquire(
+        self, db_path: Path
+    ) -> tuple[sqlite3.Connection, ThreadPoolExecutor]:
+        """
+        Borrow the shared connection for a database file, opening it if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+
+        Returns:
+            Tuple of (connection, executor owning the connection's thread)
+        """
+        key = self._key(db_path)
+        with self._lock:
+            shared = self._connections.get(key)
+            if shared is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="ticketdb"
+                )
+                shared = (executor.submit(self._open, db_path), executor)
+                self._connections[key] = shared
+                self._refcounts[key] = 0
+            self._refcounts[key] += 1
+
+        opening, executor = shared
+        try:
+            conn = await asyncio.wrap_future(opening)
+        except BaseException:
+            # Drop this borrow; the last one out discards the failed open
+            with self._lock:
+                self._refcounts[key] -= 1
+                if self._refcounts[key] == 0:
+                    del self._refcounts[key]
+                    del self._connections[key]
+                    # Runs after the open on the same worker thread, so a
+                    # connection that still opens (cancelled borrow) is closed
+                    executor.submit(self._discard, opening)
+                    executor.shutdown(wait=False)
+            raise
+        return conn, executor
+
+    async def release(self, db_path: Path) -> None:
+        """
+        Return a borrowed connection, closing it when no handles remain.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        key = self._key(db_path)
+        with self._lock:
+            self._refcounts[key] -= 1
+            if self._refcounts[key] > 0:
+                return
+            del self._refcounts[key]
+            opening, executor = self._connections.pop(key)
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                executor, self._close, opening.result()
+            )
+        finally:
+            executor.shutdown(wait=False)
+
+
+# Module-level singleton shared by all TicketDB handles
+_pool = TicketDBPool()
+
 
 class TicketDB:
     """
     Async context manager for ticket database operations.
 
+    A thin handle that borrows the shared connection from TicketDBPool on
+    enter and returns it on exit. Queries run on the connection's dedicated
+    thread via run_in_executor.
+
     Example:
         async with TicketDB(Path("tickets.db")) as db:
             ticket = await db.create_or_update_ticket(violation)
@@ -43,163 +219,101 @@ class TicketDB:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
-        self._conn: aiosqlite.Connection | None = None
+        self._conn: sqlite3.Connection | None = None
+        self._executor: ThreadPoolExecutor | None = None
 
     async def __aenter__(self) -> "TicketDB":
-        """Open database connection and ensure schema exists."""
-        self._conn = await aiosqlite.connect(self.db_path)
-        self._conn.row_factory = aiosqlite.Row
-        await self._ensure_schema()
+        """Borrow the shared connection (schema is ensured on first open)."""
+        self._conn, self._executor = await _pool.acquire(self.db_path)
         return self
 
     async def __aexit__(self, *args: Any) -> None:
-        """Close database connection."""
+        """Release the shared connection back to the pool."""
         if self._conn:
-            await self._conn.close()
             self._conn = None
+            self._executor = None
+            await _pool.release(self.db_path)
 
-    async def _ensure_schema(self) -> None:
-        """Create tables and indexes if they don't exist."""
-        await self._conn.executescript(SCHEMA_SQL)
-        await self._conn.commit()
-
-    def _row_to_ticket(self, row: aiosqlite.Row) -> Ticket:
-        """
-        Convert a database row to a Ticket dataclass.
-
-        Args:
-            row: Database row with ticket fields
-
-        Returns:
-            Ticket instance
-        """
-        # Parse datetime strings
-        first_seen_at = datetime.fromisoformat(row["first_seen_at"])
-        last_seen_at = datetime.fromisoformat(row["last_seen_at"])
-        resolved_at = (
-            datetime.fromisoformat(row["resolved_at"])
-            if row["resolved_at"]
-            else None
-        )
-        created_at = (
-            datetime.fromisoformat(row["created_at"])
-            if row["created_at"]
-            else None
-        )
-        updated_at = (
-            datetime.fromisoformat(row["updated_at"])
-            if row["updated_at"]
-            else None
-        )
-
-        # Parse metric_snapshot JSON
-        metric_snapshot = (
-            json.loads(row["metric_snapshot"])
-            if row["metric_snapshot"]
-            else None
-        )
+    async def _run(self, func: Callable[[], T]) -> T:
+        """Run a synchronous database function on the connection's thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
 
-        return Ticket(
-            id=row["id"],
-            violation_key=row["violation_key"],
-            invariant_name=row["invariant_name"],
-            message=row["message"],
-            severity=row["severity"],
-            first_seen_at=first_seen_at,
-            last_seen_at=last_seen_at,
-            status=TicketStatus(row["status"]),
-            store_id=row["store_id"],
-            held=bool(row["held"]),
-            batch_key=row["batch_key"],
-            occurrence_count=row["occurrence_count"],
-            resolved_at=resolved_at,
-            diagnosis=row["diagnosis"],
-            metric_snapshot=metric_snapshot,
-            subject_context=row["subject_context"],
-            variant_model=row["variant_model"],
-            variant_system_prompt=row["variant_system_prompt"],
-            variant_tools_config=row["variant_tools_config"],
-            created_at=created_at,
-            updated_at=updated_at,
-        )
+    def _fetch_ticket(self, ticket_id: int) -> Ticket | None:
+        """Synchronously fetch a ticket by ID (call on the DB thread)."""
+        row = self._conn.execute(
+            f"SELECT {COLUMNS_SQL} FROM tickets WHERE id = ?",
+            (ticket_id,),
+        ).fetchone()
+        return Ticket.from_row(row) if row else None
 
-    async def create_or_update_ticket(
+    def _upsert_ticket(
         self,
         violation: InvariantViolation,
-        metric_snapshot: dict[str, Any] | None = None,
-        batch_key: str | None = None,
-        subject_context: str | None = None,
+        now: str,
+        snapshot_json: str | None,
+        batch_key: str | None,
+        subject_context: str | None,
     ) -> Ticket:
         """
-        Create a new ticket or update an existing open ticket.
-
-        Implements deduplication: if an open ticket exists for the same
-        violation_key, it will be updated instead of creating a duplicate.
-
-        Args:
-            violation: The invariant violation
-            metric_snapshot: Optional metrics captured at violation time
-            batch_key: Optional key to group related violations
-            subject_context: Optional subject-specific agent prompt context
+        Create or update the ticket for one violation (call on the DB thread).
 
-        Returns:
-            The created or updated Ticket
+        Does not commit; callers own the transaction.
         """
         violation_key = make_violation_key(violation)
-        now = datetime.now()
 
         # Check for existing open ticket (atomic with subsequent operation)
-        async with self._conn.execute(
+        row = self._conn.execute(
             """
-            SELECT * FROM tickets
+            SELECT id, status FROM tickets
             WHERE violation_key = ? AND status != 'resolved'
             """,
             (violation_key,),
-        ) as cursor:
-            row = await cursor.fetchone()
+        ).fetchone()
 
         if row:
             # Update existing ticket
             # If ticket was diagnosed/escalated, re-open it for agent retry
-            current_status = row["status"]
-            if current_status == "diagnosed":
+            if row.status == "diagnosed":
                 # Re-open for agent to retry
-                await self._conn.execute(
-                    """
+                updated = self._conn.execute(
+                    f"""
                     UPDATE tickets SET
                         last_seen_at = ?,
                         occurrence_count = occurrence_count + 1,
                         message = ?,
                         status = 'open',
                         held = 0,
-                        diagnosis = NULL
+                        diagnosis = NULL,
+                        updated_at = CURRENT_TIMESTAMP
                     WHERE id = ?
+                    RETURNING {COLUMNS_SQL}
                     """,
-                    (now.isoformat(), violation.message, row["id"]),
-                )
+                    (now, violation.message, row.id),
+                ).fetchone()
             else:
                 # Just update occurrence count
-                await self._conn.execute(
-                    """
+                updated = self._conn.execute(
+                    f"""
                     UPDATE tickets SET
                         last_seen_at = ?,
                         occurrence_count = occurrence_count + 1,
-                        message = ?
+                        message = ?,
+                        updated_at = CURRENT_TIMESTAMP
                     WHERE id = ?
+                    RETURNING {COLUMNS_SQL}
                     """,
-                    (now.isoformat(), violation.message, row["id"]),
-                )
-            await self._conn.commit()
-            return await self.get_ticket(row["id"])
+                    (now, violation.message, row.id),
+                ).fetchone()
+            return Ticket.from_row(updated)
 
         # Create new ticket
-        snapshot_json = json.dumps(metric_snapshot) if metric_snapshot else None
-        cursor = await self._conn.execute(
-            """
+        created = self._conn.execute(
+            f"""
             INSERT INTO tickets (
                 violation_key, invariant_name, store_id, message, severity,
                 first_seen_at, last_seen_at, batch_key, metric_snapshot, subject_context
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING {COLUMNS_SQL}
             """,
             (
                 violation_key,
@@ -208,17 +322,86 @@ class TicketDB:
                 violation.message,
                 violation.severity,
                 violation.first_seen.isoformat(),
-                now.isoformat(),
+                now,
                 batch_key,
                 snapshot_json,
                 subject_context,
             ),
+        ).fetchone()
+
+        # RETURNING hands back the written row without a second lookup
+        return Ticket.from_row(created)
+
+    async def create_or_update_ticket(
+        self,
+        violation: InvariantViolation,
+        metric_snapshot: dict[str, Any] | None = None,
+        batch_key: str | None = None,
+        subject_context: str | None = None,
+    ) -> Ticket:
+        """
+        Create a new ticket or update an existing open ticket.
+
+        Implements deduplication: if an open ticket exists for the same
+        violation_key, it will be updated instead of creating a duplicate.
+
+        Args:
+            violation: The invariant violation
+            metric_snapshot: Optional metrics captured at violation time
+            batch_key: Optional key to group related violations
+            subject_context: Optional subject-specific agent prompt context
+
+        Returns:
+            The created or updated Ticket
+        """
+        tickets = await self.create_or_update_tickets(
+            [violation],
+            metric_snapshot=metric_snapshot,
+            batch_key=batch_key,
+            subject_context=subject_context,
         )
-        await self._conn.commit()
+        return tickets[0]
 
-        # Fetch and return the created ticket
-        ticket_id = cursor.lastrowid
-        return await self.get_ticket(ticket_id)
+    async def create_or_update_tickets(
+        self,
+        violations: Sequence[InvariantViolation],
+        metric_snapshot: dict[str, Any] | None = None,
+        batch_key: str | None = None,
+        subject_context: str | None = None,
+    ) -> list[Ticket]:
+        """
+        Create or update tickets for a batch of violations in one transaction.
+
+        Applies the same deduplication as create_or_update_ticket to each
+        violation. The whole batch crosses to the DB thread once, the
+        metric_snapshot JSON is serialized there (off the event loop), and
+        all writes share a single commit.
+
+        Args:
+            violations: The invariant violations, e.g. from one check cycle
+            metric_snapshot: Optional metrics captured at violation time
+            batch_key: Optional key to group related violations
+            subject_context: Optional subject-specific agent prompt context
+
+        Returns:
+            The created or updated Tickets, in the order of violations
+        """
+        if not violations:
+            return []
+        now = datetime.now().isoformat()
+
+        def upsert_all() -> list[Ticket]:
+            snapshot_json = json.dumps(metric_snapshot) if metric_snapshot else None
+            # Connection context manager commits on success, rolls back on error
+            with self._conn:
+                return [
+                    self._upsert_ticket(
+                        violation, now, snapshot_json, batch_key, subject_context
+                    )
+                    for violation in violations
+                ]
+
+        return await self._run(upsert_all)
 
     async def get_ticket(self, ticket_id: int) -> Ticket | None:
         """
@@ -230,15 +413,7 @@ class TicketDB:
         Returns:
             The Ticket if found, None otherwise
         """
-        async with self._conn.execute(
-            "SELECT * FROM tickets WHERE id = ?",
-            (ticket_id,),
-        ) as cursor:
-            row = await cursor.fetchone()
-
-        if row:
-            return self._row_to_ticket(row)
-        return None
+        return await self._run(lambda: self._fetch_ticket(ticket_id))
 
     async def list_tickets(
         self,
@@ -254,16 +429,22 @@ class TicketDB:
             List of tickets ordered by created_at DESC
         """
         if status:
-            query = "SELECT * FROM tickets WHERE status = ? ORDER BY created_at DESC"
+            query = f"SELECT {COLUMNS_SQL} FROM tickets WHERE status = ? ORDER BY created_at DESC"
             params = (status.value,)
         else:
-            query = "SELECT * FROM tickets ORDER BY created_at DESC"
+            query = f"SELECT {COLUMNS_SQL} FROM tickets ORDER BY created_at DESC"
             params = ()
 
-        async with self._conn.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
+        def fetch() -> list[Ticket]:
+            rows = self._conn.execute(query, params).fetchall()
+            return [Ticket.from_row(row) for row in rows]
+
+        return await self._run(fetch)
 
-        return [self._row_to_ticket(row) for row in rows]
+    def _execute_commit(self, sql: str, params: tuple = ()) -> None:
+        """Execute a single write statement and commit (call on the DB thread)."""
+        self._conn.execute(sql, params)
+        self._conn.commit()
 
     async def resolve_ticket(self, ticket_id: int) -> None:
         """
@@ -274,17 +455,16 @@ class TicketDB:
         Args:
             ticket_id: The ticket ID to resolve
         """
-        now = datetime.now()
-        await self._conn.execute(
-            """
+        await self._run(lambda: self._execute_commit(
+            f"""
             UPDATE tickets SET
                 status = 'resolved',
-                resolved_at = ?
+                resolved_at = {SQL_RESOLVED_AT},
+                updated_at = CURRENT_TIMESTAMP
             WHERE id = ? AND held = 0
             """,
-            (now.isoformat(), ticket_id),
-        )
-        await self._conn.commit()
+            (ticket_id,),
+        ))
 
     async def hold_ticket(self, ticket_id: int) -> None:
         """
@@ -295,11 +475,10 @@ class TicketDB:
         Args:
             ticket_id: The ticket ID to hold
         """
-        await self._conn.execute(
-            "UPDATE tickets SET held = 1 WHERE id = ?",
+        await self._run(lambda: self._execute_commit(
+            "UPDATE tickets SET held = 1, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
             (ticket_id,),
-        )
-        await self._conn.commit()
+        ))
 
     async def unhold_ticket(self, ticket_id: int) -> None:
         """
@@ -308,15 +487,14 @@ class TicketDB:
         Args:
             ticket_id: The ticket ID to unhold
         """
-        await self._conn.execute(
-            "UPDATE tickets SET held = 0 WHERE id = ?",
+        await self._run(lambda: self._execute_commit(
+            "UPDATE tickets SET held = 0, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
             (ticket_id,),
-        )
-        await self._conn.commit()
+        ))
 
     async def auto_resolve_cleared(
         self,
-        current_violation_keys: set[str],
+        current_violation_keys: Collection[str],
     ) -> int:
         """
         Auto-resolve open tickets whose violations have cleared.
@@ -325,39 +503,41 @@ class TicketDB:
         of active violations. Respects the held flag.
 
         Args:
-            current_violation_keys: Set of currently active violation keys
+            current_violation_keys: Currently active violation keys;
+                duplicates are tolerated
 
         Returns:
             Number of tickets that were resolved
         """
-        now = datetime.now()
 
-        # Get all open, non-held tickets
-        async with self._conn.execute(
-            """
-            SELECT id, violation_key FROM tickets
-            WHERE status != 'resolved' AND held = 0
-            """,
-        ) as cursor:
-            rows = await cursor.fetchall()
-
-        # Resolve tickets whose violations have cleared
-        resolved_count = 0
-        for row in rows:
-            if row["violation_key"] not in current_violation_keys:
-                await self._conn.execute(
-                    """
+        def resolve_cleared() -> int:
+            # Stage the live keys in a per-connection TEMP table so the
+            # cleared set is resolved by one UPDATE instead of a SELECT
+            # plus one UPDATE per ticket. The connection context manager
+            # rolls back on error so a failure cannot leave the shared
+            # connection inside an open transaction.
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TEMP TABLE IF NOT EXISTS _live_keys (k TEXT PRIMARY KEY)"
+                )
+                self._conn.execute("DELETE FROM _live_keys")
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO _live_keys (k) VALUES (?)",
+                    [(key,) for key in current_violation_keys],
+                )
+                cursor = self._conn.execute(
+                    f"""
                     UPDATE tickets SET
                         status = 'resolved',
-                        resolved_at = ?
-                    WHERE id = ?
+                        resolved_at = {SQL_RESOLVED_AT},
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE status != 'resolved' AND held = 0
+                      AND violation_key NOT IN (SELECT k FROM _live_keys)
                     """,
-                    (now.isoformat(), row["id"]),
                 )
-                resolved_count += 1
+            return cursor.rowcount
 
-        await self._conn.commit()
-        return resolved_count
+        return await self._run(resolve_cleared)
 
     async def update_diagnosis(
         self,
@@ -374,13 +554,13 @@ class TicketDB:
             ticket_id: The ticket ID to update
             diagnosis: Markdown-formatted diagnosis text
         """
-        await self._conn.execute(
+        await self._run(lambda: self._execute_commit(
             """
             UPDATE tickets SET
                 diagnosis = ?,
-                status = 'diagnosed'
+                status = 'diagnosed',
+                updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
             """,
             (diagnosis, ticket_id),
-        )
-        await self._conn.commit()
+        ))
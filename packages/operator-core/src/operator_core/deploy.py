@@ -5,8 +5,10 @@ This module provides:
 - DeploymentTarget Protocol: Interface for deployment targets (local, AWS, etc.)
 - LocalDeployment: Docker Compose-based local deployment implementation
 - Status types: ServiceStatus and DeploymentStatus for structured status info
+- get_docker_client: Process-wide DockerClient per compose file
 """
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
@@ -34,6 +36,26 @@ class DeploymentStatus:
     all_healthy: bool
 
 
+def get_docker_client(compose_file: Path) -> DockerClient:
+    """Get the shared DockerClient for a compose file.
+
+    Clients are memoized on the resolved path, so every caller in the
+    process that targets the same compose file shares one client.
+
+    Args:
+        compose_file: Path to the docker-compose.yaml file.
+
+    Returns:
+        DockerClient configured with the compose file.
+    """
+    return _docker_client_for(compose_file.resolve())
+
+
+@functools.lru_cache(maxsize=16)
+def _docker_client_for(compose_file: Path) -> DockerClient:
+    return DockerClient(compose_files=[compose_file])
+
+
 class DeploymentTarget(Protocol):
     """Interface for deployment targets (local, AWS, etc.).
 
@@ -101,7 +123,7 @@ class LocalDeployment:
             project_name: Optional project name for Docker Compose.
         """
         self.compose_file = compose_file
-        self.docker = DockerClient(compose_files=[compose_file])
+        self.docker = get_docker_client(compose_file)
         self.console = Console()
         self.project_name = project_name
 
@@ -12,11 +12,18 @@ This module implements the monitor loop daemon that:
 Per RESEARCH.md Pattern 2: Daemon Loop with Signal Handling
 - Uses asyncio.Event for shutdown coordination
 - Registers signal handlers inside run() with get_running_loop()
-- Uses wait_for with timeout for interruptible sleep
+- Uses asyncio.timeout around Event.wait() for interruptible sleep
+
+Status messages go through the module logger rather than print(); the
+monitor CLI routes them to stdout from a background thread. When
+MonitorLoop is used outside the CLI, configure logging for
+operator_core.monitor (e.g. logging.basicConfig(level=logging.INFO)):
+the root logger's default WARNING level drops the INFO status output.
 """
 
 import asyncio
 import functools
+import logging
 import signal
 from datetime import datetime
 from pathlib import Path
@@ -29,6 +36,8 @@ from operator_protocols import (
     SubjectProtocol,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class MonitorLoop:
     """
@@ -80,8 +89,8 @@ class MonitorLoop:
         self._subject_context = subject_context
         self._shutdown = asyncio.Event()
 
-        # Stats for heartbeat
-        self._violation_count = 0
+        # Stats for heartbeat (None when the last check cycle failed)
+        self._violation_count: int | None = 0
         self._last_check: datetime | None = None
 
     async def run(self) -> None:
@@ -101,7 +110,7 @@ class MonitorLoop:
                 functools.partial(self._handle_signal, sig),
             )
 
-        print(f"Monitor loop starting (interval: {self.interval}s)")
+        logger.info("Monitor loop starting (interval: %ss)", self.interval)
 
         async with TicketDB(self.db_path) as db:
             while not self._shutdown.is_set():
@@ -109,20 +118,20 @@ class MonitorLoop:
                 self._log_heartbeat()
 
                 # Wait for interval or shutdown signal
-                # Per RESEARCH.md: Use Event.wait() with timeout, not asyncio.sleep
+                # Per RESEARCH.md: Use Event.wait() with timeout, not asyncio.sleep.
+                # asyncio.timeout awaits the wait directly instead of wrapping
+                # it in a new task every cycle like wait_for does
                 try:
-                    await asyncio.wait_for(
-                        self._shutdown.wait(),
-                        timeout=self.interval,
-                    )
-                except asyncio.TimeoutError:
+                    async with asyncio.timeout(self.interval):
+                        await self._shutdown.wait()
+                except TimeoutError:
                     pass  # Normal timeout, continue loop
 
-        print("Monitor loop stopped")
+        logger.info("Monitor loop stopped")
 
     def _handle_signal(self, sig: signal.Signals) -> None:
         """Handle shutdown signal by setting shutdown event."""
-        print(f"Received {sig.name}, shutting down...")
+        logger.info("Received %s, shutting down...", sig.name)
         self._shutdown.set()
 
     async def _check_cycle(self, db: TicketDB) -> None:
@@ -146,36 +155,48 @@ class MonitorLoop:
             # Generic check pattern - checker handles all invariant checking
             violations = self.checker.check(observation)
         except Exception as e:
-            # Log but don't crash on observation/check failure
-            print(f"Check cycle failed: {e}")
-            import traceback
-            traceback.print_exc()
-            violations = []
+            # Log but don't crash on observation/check failure. Skip the
+            # ticket updates too: treating a failed observation as "no
+            # violations" would auto-resolve every open ticket.
+            logger.exception("Check cycle failed: %s", e)
+            self._violation_count = None
+            return
+
+        # Collapse repeats of the same violation key (last one wins) so a
+        # ticket is upserted once per cycle, not once per duplicate
+        deduped = {make_violation_key(v): v for v in violations}
 
         # Track stats
-        self._violation_count = len(violations)
-
-        # Create/update tickets for violations
-        if violations:
-            batch_key = f"batch-{datetime.now().isoformat()}"
-            for v in violations:
-                ticket = await db.create_or_update_ticket(
-                    v,
-                    batch_key=batch_key,
-                    subject_context=self._subject_context,
-                )
+        self._violation_count = len(deduped)
+
+        # Create/update tickets for violations in one transaction
+        if deduped:
+            # Reuse the cycle's start time; a counter would repeat across
+            # restarts, and batch_key persists in the tickets table
+            batch_key = f"batch-{self._last_check.isoformat()}"
+            tickets = await db.create_or_update_tickets(
+                list(deduped.values()),
+                batch_key=batch_key,
+                subject_context=self._subject_context,
+            )
+            for ticket in tickets:
                 if ticket.occurrence_count == 1:
-                    print(f"Created ticket {ticket.id}: {ticket.invariant_name}")
+                    logger.info(
+                        "Created ticket %s: %s", ticket.id, ticket.invariant_name
+                    )
 
         # Auto-resolve cleared violations (per CONTEXT.md)
-        current_keys = {make_violation_key(v) for v in violations}
-        resolved_count = await db.auto_resolve_cleared(current_keys)
+        resolved_count = await db.auto_resolve_cleared(deduped.keys())
         if resolved_count > 0:
-            print(f"Auto-resolved {resolved_count} ticket(s)")
+            logger.info("Auto-resolved %d ticket(s)", resolved_count)
 
     def _log_heartbeat(self) -> None:
         """Output periodic status message per CONTEXT.md."""
-        if self._violation_count == 0:
-            print("Check complete: all passing")
+        if self._violation_count is None:
+            logger.warning("Check failed: violation state unknown")
+        elif self._violation_count == 0:
+            logger.info("Check complete: all passing")
         else:
-            print(f"Check complete: {self._violation_count} violation(s) detected")
+            logger.info(
+                "Check complete: %d violation(s) detected", self._violation_count
+            )
@@ -4,24 +4,30 @@ Ticket types for the monitoring system.
 This module defines the core data structures for ticket management:
 - TicketStatus: Enum for valid ticket states
 - Ticket: Dataclass representing a monitoring ticket
+- TICKET_COLUMNS: Ticket column names in Ticket.from_row() order
 - make_violation_key: Function to generate deduplication keys
+- violation_key_for: Memoized key formatting from name and store_id
 
 Per RESEARCH.md patterns:
 - Use str enum for easy JSON serialization
 - Dataclass with to_dict() for database persistence
+- Slotted dataclass with from_row() for positional row conversion
 - Violation key format: invariant_name:store_id
 """
 
-from dataclasses import asdict, dataclass
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from functools import lru_cache
 from typing import Any
 
 from operator_protocols import InvariantViolation
 
 
-class TicketStatus(str, Enum):
-    """Valid ticket status values."""
+class TicketStatus(StrEnum):
+    """Valid ticket status values (members are their own str values)."""
 
     OPEN = "open"
     ACKNOWLEDGED = "acknowledged"
@@ -29,7 +35,7 @@ class TicketStatus(str, Enum):
     RESOLVED = "resolved"
 
 
-@dataclass
+@dataclass(slots=True)
 class Ticket:
     """
     Represents a monitoring ticket for an invariant violation.
@@ -81,11 +87,88 @@ class Ticket:
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "Ticket":
+        """
+        Build a Ticket from a database row.
+
+        The row is consumed positionally, so it must be selected with the
+        columns in TICKET_COLUMNS order. Timestamps are parsed from ISO8601
+        text and metric_snapshot from JSON.
+
+        Args:
+            row: Row tuple (plain, namedtuple or sqlite3.Row)
+
+        Returns:
+            Ticket instance
+        """
+        (
+            id_, violation_key, invariant_name, message, severity,
+            first_seen_at, last_seen_at, status, store_id, held, batch_key,
+            occurrence_count, resolved_at, diagnosis, metric_snapshot,
+            subject_context, variant_model, variant_system_prompt,
+            variant_tools_config, created_at, updated_at,
+        ) = row
+        parse = datetime.fromisoformat
+        return cls(
+            id_,
+            violation_key,
+            invariant_name,
+            message,
+            severity,
+            parse(first_seen_at),
+            parse(last_seen_at),
+            TicketStatus(status),
+            store_id,
+            bool(held),
+            batch_key,
+            occurrence_count,
+            parse(resolved_at) if resolved_at else None,
+            diagnosis,
+            json.loads(metric_snapshot) if metric_snapshot else None,
+            subject_context,
+            variant_model,
+            variant_system_prompt,
+            variant_tools_config,
+            parse(created_at) if created_at else None,
+            parse(updated_at) if updated_at else None,
+        )
+
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dict for JSON serialization."""
-        d = asdict(self)
-        d["status"] = self.status.value
-        return d
+        """
+        Convert to dict for JSON serialization.
+
+        Built field by field rather than with dataclasses.asdict, which
+        deep-copies every value. metric_snapshot is shared with the ticket,
+        not copied; callers must not mutate it.
+        """
+        return {
+            "id": self.id,
+            "violation_key": self.violation_key,
+            "invariant_name": self.invariant_name,
+            "message": self.message,
+            "severity": self.severity,
+            "first_seen_at": self.first_seen_at,
+            "last_seen_at": self.last_seen_at,
+            "status": self.status,
+            "store_id": self.store_id,
+            "held": self.held,
+            "batch_key": self.batch_key,
+            "occurrence_count": self.occurrence_count,
+            "resolved_at": self.resolved_at,
+            "diagnosis": self.diagnosis,
+            "metric_snapshot": self.metric_snapshot,
+            "subject_context": self.subject_context,
+            "variant_model": self.variant_model,
+            "variant_system_prompt": self.variant_system_prompt,
+            "variant_tools_config": self.variant_tools_config,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+# Column order expected by Ticket.from_row (matches the dataclass fields)
+TICKET_COLUMNS = tuple(f.name for f in fields(Ticket))
 
 
 def make_violation_key(violation: InvariantViolation) -> str:
@@ -102,6 +185,25 @@ def make_violation_key(violation: InvariantViolation) -> str:
     Returns:
         Key in format "invariant_name:store_id" or just "invariant_name"
     """
-    if violation.store_id:
-        return f"{violation.invariant_name}:{violation.store_id}"
-    return violation.invariant_name
+    return violation_key_for(violation.invariant_name, violation.store_id)
+
+
+@lru_cache(maxsize=4096)
+def violation_key_for(invariant_name: str, store_id: str | None) -> str:
+    """
+    Generate a deduplication key from its parts.
+
+    The same few invariant/store pairs recur every check cycle, so keys
+    are memoized: repeat calls return the same string object instead of
+    formatting a new one.
+
+    Args:
+        invariant_name: Name of the violated invariant
+        store_id: Optional store/entity ID the violation applies to
+
+    Returns:
+        Key in format "invariant_name:store_id" or just "invariant_name"
+    """
+    if store_id:
+        return f"{invariant_name}:{store_id}"
+    return invariant_name
@@ -5,6 +5,7 @@ Verifies that MonitorLoop works with any subject implementing SubjectProtocol,
 not just TiKVSubject. This proves the abstraction is correct.
 """
 
+import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -254,6 +255,41 @@ class TestMonitorLoopWithViolations:
             tickets = await db.list_tickets()
             assert len(tickets) == 0
 
+    @pytest.mark.asyncio
+    async def test_duplicate_violations_upsert_once(self, tmp_path):
+        """Repeated violations for one key should count as one occurrence."""
+        subject = MockSubject()
+        now = datetime.now()
+        violations = [
+            InvariantViolation(
+                invariant_name="test_invariant",
+                message=f"Test violation {i}",
+                first_seen=now,
+                last_seen=now,
+                store_id="node-1",
+            )
+            for i in range(2)
+        ]
+        checker = MockChecker(violations=violations)
+        db_path = tmp_path / "test.db"
+
+        loop = MonitorLoop(
+            subject=subject,
+            checker=checker,
+            db_path=db_path,
+            interval_seconds=1.0,
+        )
+
+        from operator_core.db.tickets import TicketDB
+
+        async with TicketDB(db_path) as db:
+            await loop._check_cycle(db)
+            tickets = await db.list_tickets()
+
+        assert len(tickets) == 1
+        assert tickets[0].occurrence_count == 1
+        assert loop._violation_count == 1
+
 
 class TestMonitorLoopAutoResolve:
     """Tests MonitorLoop auto-resolve functionality with generic checker."""
@@ -300,6 +336,48 @@ class TestMonitorLoopAutoResolve:
             assert len(tickets) == 1
             assert tickets[0].status == TicketStatus.RESOLVED
 
+    @pytest.mark.asyncio
+    async def test_failed_cycle_keeps_open_tickets(self, tmp_path, caplog):
+        """A failed observation should keep open tickets and be reported."""
+        subject = MockSubject()
+        now = datetime.now()
+        violation = InvariantViolation(
+            invariant_name="test_invariant",
+            message="Test violation",
+            first_seen=now,
+            last_seen=now,
+            store_id="node-1",
+        )
+        checker = MockChecker(violations=[violation])
+        db_path = tmp_path / "test.db"
+
+        loop = MonitorLoop(
+            subject=subject,
+            checker=checker,
+            db_path=db_path,
+            interval_seconds=1.0,
+        )
+
+        from operator_core.db.tickets import TicketDB
+        from operator_core.monitor.types import TicketStatus
+
+        async with TicketDB(db_path) as db:
+            await loop._check_cycle(db)
+
+            # Observation fails on the next cycle
+            subject.observe = AsyncMock(side_effect=RuntimeError("unreachable"))
+            await loop._check_cycle(db)
+
+            tickets = await db.list_tickets()
+            assert len(tickets) == 1
+            assert tickets[0].status == TicketStatus.OPEN
+
+        # The heartbeat must not repeat the previous cycle's count
+        with caplog.at_level(logging.INFO, logger="operator_core.monitor.loop"):
+            loop._log_heartbeat()
+        assert "Check failed" in caplog.text
+        assert "violation(s) detected" not in caplog.text
+
 
 class TestMonitorLoopSubjectContext:
     """Tests that subject_context is passed through to tickets."""
@@ -0,0 +1,71 @@
+"""Unit tests for the agent shell tool's output handling.
+
+Tests verify the byte budget keeps the tail of oversized output with a
+truncation marker, and that shell() decodes captured bytes correctly.
+"""
+
+from operator_core.agent_lab.tools import (
+    MAX_OUTPUT_BYTES,
+    _decode,
+    get_last_result,
+    shell,
+)
+
+
+class TestDecode:
+    """Tests for output decoding and truncation."""
+
+    def test_empty_output(self):
+        """Verify empty streams decode to an empty string."""
+        assert _decode(b"") == ""
+
+    def test_output_at_limit_is_kept_whole(self):
+        """Verify output exactly at the budget is not truncated."""
+        data = b"x" * 8
+
+        assert _decode(data, limit=8) == "x" * 8
+
+    def test_oversized_output_keeps_tail(self):
+        """Verify output over the budget drops the head and adds a marker."""
+        data = b"head" + b"x" * 4 + b"tail"
+
+        assert _decode(data, limit=8) == "... [truncated 4 bytes]\nxxxxtail"
+
+    def test_cut_inside_multibyte_character(self):
+        """Verify a character split by the cut is dropped, not garbled."""
+        data = b"ab" + "é".encode() + b"cd"  # é is 2 bytes
+
+        # Keeping 3 bytes would start on é's continuation byte
+        assert _decode(data, limit=3) == "... [truncated 4 bytes]\ncd"
+
+    def test_invalid_utf8_is_replaced(self):
+        """Verify undecodable bytes are replaced instead of raising."""
+        assert _decode(b"ok\xff") == "ok�"
+
+
+class TestShell:
+    """Tests for the shell tool's result capture."""
+
+    def test_failure_reports_stderr_and_exit_code(self):
+        """Verify stderr and the exit code are appended on failure."""
+        output = shell.call({
+            "command": "echo out; echo err >&2; exit 3",
+            "reasoning": "test",
+        })
+
+        assert output == "out\n\n\nSTDERR: err\n\nExit code: 3"
+        result = get_last_result()
+        assert result is not None
+        assert result["exit_code"] == 3
+
+    def test_large_output_is_truncated_to_tail(self):
+        """Verify output over MAX_OUTPUT_BYTES keeps the last bytes."""
+        size = MAX_OUTPUT_BYTES + 10
+        output = shell.call({
+            "command": f"head -c {size - 4} /dev/zero | tr '\\0' x; printf tail",
+            "reasoning": "test",
+        })
+
+        assert output.startswith("... [truncated 10 bytes]\n")
+        assert output.endswith("tail")
+        assert len(output) == len("... [truncated 10 bytes]\n") + MAX_OUTPUT_BYTES
@@ -0,0 +1,170 @@
+"""Unit tests for TicketDB persistence.
+
+Tests verify connection sharing via TicketDBPool and ticket lifecycle
+operations against a real SQLite file.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from operator_protocols import InvariantViolation
+
+from operator_core.db.tickets import TicketDB, _pool
+
+
+def _violation(name: str = "store_down", store_id: str | None = "1") -> InvariantViolation:
+    return InvariantViolation(
+        invariant_name=name,
+        message=f"{name} violated",
+        first_seen=datetime.now(),
+        last_seen=datetime.now(),
+        store_id=store_id,
+    )
+
+
+@pytest.fixture
+def non_utc_tz():
+    """Run the test with a local zone far from UTC so clock mixups show."""
+    previous = os.environ.get("TZ")
+    os.environ["TZ"] = "Etc/GMT+10"
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = previous
+    time.tzset()
+
+
+class TestTicketDBPool:
+    """Tests for shared connection lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_nested_handles_share_connection(self, tmp_path):
+        """Verify concurrent handles borrow the same connection."""
+        db_path = tmp_path / "tickets.db"
+
+        async with TicketDB(db_path) as outer:
+            async with TicketDB(db_path) as inner:
+                assert outer._conn is inner._conn
+
+        assert not _pool._connections
+
+    @pytest.mark.asyncio
+    async def test_reopen_after_release_sees_data(self, tmp_path):
+        """Verify data persists after the last handle closes the connection."""
+        db_path = tmp_path / "tickets.db"
+
+        async with TicketDB(db_path) as db:
+            created = await db.create_or_update_ticket(_violation())
+
+        async with TicketDB(db_path) as db:
+            ticket = await db.get_ticket(created.id)
+
+        assert ticket is not None
+        assert ticket.violation_key == "store_down:1"
+
+    def test_pool_works_across_event_loops(self, tmp_path):
+        """Verify contended borrows work under successive event loops."""
+        db_path = tmp_path / "tickets.db"
+
+        async def borrow_concurrently() -> None:
+            async def borrow() -> None:
+                async with TicketDB(db_path) as db:
+                    await db.list_tickets()
+
+            await asyncio.gather(*(borrow() for _ in range(3)))
+
+        asyncio.run(borrow_concurrently())
+        asyncio.run(borrow_concurrently())
+
+        assert not _pool._connections
+
+
+class TestTicketUpdates:
+    """Tests for ticket UPDATE paths."""
+
+    @pytest.mark.asyncio
+    async def test_updates_set_updated_at_inline(self, tmp_path):
+        """Verify updated_at advances without relying on a trigger."""
+        db_path = tmp_path / "tickets.db"
+
+        async with TicketDB(db_path) as db:
+            created = await db.create_or_update_ticket(_violation())
+            await db.hold_ticket(created.id)
+            held = await db.get_ticket(created.id)
+
+        assert held.held is True
+        assert held.updated_at is not None
+        # updated_at shares the UTC clock of the created_at INSERT default
+        assert abs(held.updated_at - held.created_at) < timedelta(seconds=5)
+
+    @pytest.mark.asyncio
+    async def test_timestamps_keep_one_clock_per_column(self, tmp_path, non_utc_tz):
+        """Verify updated_at stays UTC and resolved_at stays local on resolve."""
+        db_path = tmp_path / "tickets.db"
+
+        async with TicketDB(db_path) as db:
+            created = await db.create_or_update_ticket(_violation())
+            await db.resolve_ticket(created.id)
+            resolved = await db.get_ticket(created.id)
+
+        assert abs(resolved.updated_at - resolved.created_at) < timedelta(seconds=5)
+        assert abs(resolved.resolved_at - resolved.first_seen_at) < timedelta(seconds=5)
+
+    @pytest.mark.asyncio
+    async def test_auto_resolve_skips_live_and_held(self, tmp_path):
+        """Verify only cleared, non-held tickets are auto-resolved."""
+        db_path = tmp_path / "tickets.db"
+
+        async with TicketDB(db_path) as db:
+            live = await db.create_or_update_ticket(_violation(store_id="1"))
+            cleared = await db.create_or_update_ticket(_violation(store_id="2"))
+            held = await db.create_or_update_ticket(_violation(store_id="3"))
+            await db.hold_ticket(held.id)
+
+            resolved = await db.auto_resolve_cleared({live.violation_key})
+
+            assert resolved == 1
+            assert (await db.get_ticket(live.id)).status.value == "open"
+            assert (await db.get_ticket(cleared.id)).status.value == "resolved"
+            assert (await db.get_ticket(held.id)).status.value == "open"
+
+    @pytest.mark.asyncio
+    async def test_auto_resolve_tolerates_duplicate_keys(self, tmp_path):
+        """Verify duplicate keys neither raise nor leave a transaction open."""
+        db_path = tmp_path / "tickets.db"
+
+        async with TicketDB(db_path) as db:
+            live = await db.create_or_update_ticket(_violation(store_id="1"))
+            cleared = await db.create_or_update_ticket(_violation(store_id="2"))
+
+            resolved = await db.auto_resolve_cleared(
+                [live.violation_key, live.violation_key]
+            )
+
+            assert resolved == 1
+            assert db._conn.in_transaction is False
+            assert (await db.get_ticket(cleared.id)).status.value == "resolved"
+
+        # Closing the pooled connection must not hit a locked table
+        async with TicketDB(db_path) as db:
+            assert (await db.get_ticket(live.id)).status.value == "open"
+
+    @pytest.mark.asyncio
+    async def test_batch_upsert_dedups_and_preserves_order(self, tmp_path):
+        """Verify batched writes return tickets in input order and dedup."""
+        db_path = tmp_path / "tickets.db"
+        violations = [_violation(store_id="1"), _violation(store_id="2")]
+
+        async with TicketDB(db_path) as db:
+            first = await db.create_or_update_tickets(violations, batch_key="b1")
+            second = await db.create_or_update_tickets(violations, batch_key="b2")
+
+        assert [t.violation_key for t in first] == ["store_down:1", "store_down:2"]
+        assert [t.id for t in second] == [t.id for t in first]
+        assert [t.occurrence_count for t in second] == [2, 2]
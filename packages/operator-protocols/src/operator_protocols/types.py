@@ -16,7 +16,7 @@ StoreId = str
 """Unique identifier for a node in a distributed system."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Store:
     """
     Represents a node in a distributed system.
@@ -40,7 +40,7 @@ class Store:
     state: str
 
 
-@dataclass
+@dataclass(slots=True)
 class StoreMetrics:
     """
     Performance and resource metrics for a single node.
@@ -16,6 +16,12 @@ from ratelimiter_observer.redis_client import RedisClient
 from ratelimiter_observer.subject import RateLimiterSubject
 
 
+# Idle keep-alive connections outlive the monitor's default 30s check
+# interval, so each cycle reuses them instead of reconnecting (httpx's
+# default expiry is 5s)
+HTTP_LIMITS = httpx.Limits(keepalive_expiry=60.0)
+
+
 def create_ratelimiter_subject_and_checker(
     ratelimiter_url: str,
     redis_url: str,
@@ -36,11 +42,13 @@ def create_ratelimiter_subject_and_checker(
         redis_url: Redis connection URL (e.g., "redis://localhost:6379")
         prometheus_url: Prometheus API URL (e.g., "http://prometheus:9090")
         rl_http: Optional pre-configured httpx client for rate limiter API.
-            If None, a new client is created with 10s timeout.
+            If None, a new client is created with 10s timeout and
+            long-lived keep-alive connections.
         redis_client: Optional pre-configured redis.asyncio.Redis client.
             If None, a new client is created from redis_url with decode_responses=True.
         prom_http: Optional pre-configured httpx client for Prometheus.
-            If None, a new client is created with 10s timeout.
+            If None, a new client is created with 10s timeout and
+            long-lived keep-alive connections.
 
     Returns:
         Tuple of (RateLimiterSubject, RateLimiterInvariantChecker) instances ready for use.
@@ -57,11 +65,15 @@ def create_ratelimiter_subject_and_checker(
         violations = checker.check(observation)
     """
     if rl_http is None:
-        rl_http = httpx.AsyncClient(base_url=ratelimiter_url, timeout=10.0)
+        rl_http = httpx.AsyncClient(
+            base_url=ratelimiter_url, timeout=10.0, limits=HTTP_LIMITS
+        )
     if redis_client is None:
         redis_client = redis.Redis.from_url(redis_url, decode_responses=True)
     if prom_http is None:
-        prom_http = httpx.AsyncClient(base_url=prometheus_url, timeout=10.0)
+        prom_http = httpx.AsyncClient(
+            base_url=prometheus_url, timeout=10.0, limits=HTTP_LIMITS
+        )
 
     subject = RateLimiterSubject(
         ratelimiter=RateLimiterClient(http=rl_http),
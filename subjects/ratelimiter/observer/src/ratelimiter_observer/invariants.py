@@ -260,23 +260,29 @@ class RateLimiterInvariantChecker:
 
         for node in nodes:
             is_down = node.state != "Up"
-            current_down_nodes.add(node.id) if is_down else None
+            if is_down:
+                current_down_nodes.add(node.id)
 
             violation = self._check_with_grace_period(
                 config=config,
                 is_violated=is_down,
-                message=f"Node {node.id} at {node.address} is {node.state}",
+                # Only format a message when there is something to report
+                message=(
+                    f"Node {node.id} at {node.address} is {node.state}"
+                    if is_down
+                    else ""
+                ),
                 identifier=node.id,
             )
             if violation:
                 violations.append(violation)
 
         # Clear tracking for nodes that came back up
+        prefix = f"{config.name}:"
         keys_to_clear = [
             key
             for key in self._first_seen
-            if key.startswith(f"{config.name}:")
-            and key.split(":", 1)[1] not in current_down_nodes
+            if key.startswith(prefix) and key[len(prefix):] not in current_down_nodes
         ]
         for key in keys_to_clear:
             self._first_seen.pop(key, None)
@@ -369,7 +375,11 @@ class RateLimiterInvariantChecker:
             violation = self._check_with_grace_period(
                 config=OVER_LIMIT_CONFIG,
                 is_violated=is_over_limit,
-                message=f"Counter {counter.key} over limit: count={counter.count}, limit={counter.limit} (excess={counter.count - counter.limit})",
+                message=(
+                    f"Counter {counter.key} over limit: count={counter.count}, limit={counter.limit} (excess={counter.count - counter.limit})"
+                    if is_over_limit
+                    else ""
+                ),
                 identifier=counter.key,
             )
             if violation:
@@ -383,20 +393,26 @@ class RateLimiterInvariantChecker:
             violation = self._check_with_grace_period(
                 config=GHOST_ALLOWING_CONFIG,
                 is_violated=is_ghost,
-                message=f"Counter {counter.key} has limit=0 but remaining={counter.remaining} (ghost allowing)",
+                message=(
+                    f"Counter {counter.key} has limit=0 but remaining={counter.remaining} (ghost allowing)"
+                    if is_ghost
+                    else ""
+                ),
                 identifier=counter.key,
             )
             if violation:
                 violations.append(violation)
 
         # Clear tracking for keys that no longer have violations
+        over_prefix = f"{OVER_LIMIT_CONFIG.name}:"
+        ghost_prefix = f"{GHOST_ALLOWING_CONFIG.name}:"
         keys_to_clear = [
             key
             for key in self._first_seen
-            if (key.startswith(f"{OVER_LIMIT_CONFIG.name}:")
-                and key.split(":", 1)[1] not in current_over_limit_keys)
-            or (key.startswith(f"{GHOST_ALLOWING_CONFIG.name}:")
-                and key.split(":", 1)[1] not in current_ghost_keys)
+            if (key.startswith(over_prefix)
+                and key[len(over_prefix):] not in current_over_limit_keys)
+            or (key.startswith(ghost_prefix)
+                and key[len(ghost_prefix):] not in current_ghost_keys)
         ]
         for key in keys_to_clear:
             self._first_seen.pop(key, None)
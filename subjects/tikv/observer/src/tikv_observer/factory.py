@@ -14,6 +14,12 @@ from tikv_observer.prom_client import PrometheusClient
 from tikv_observer.subject import TiKVSubject
 
 
+# Idle keep-alive connections outlive the monitor's default 30s check
+# interval, so each cycle reuses them instead of reconnecting (httpx's
+# default expiry is 5s)
+HTTP_LIMITS = httpx.Limits(keepalive_expiry=60.0)
+
+
 def create_tikv_subject_and_checker(
     pd_endpoint: str,
     prometheus_url: str,
@@ -31,9 +37,11 @@ def create_tikv_subject_and_checker(
         pd_endpoint: PD API endpoint URL (e.g., "http://pd:2379")
         prometheus_url: Prometheus API URL (e.g., "http://prometheus:9090")
         pd_http: Optional pre-configured httpx client for PD API.
-            If None, a new client is created with 10s timeout.
+            If None, a new client is created with 10s timeout and
+            long-lived keep-alive connections.
         prom_http: Optional pre-configured httpx client for Prometheus.
-            If None, a new client is created with 10s timeout.
+            If None, a new client is created with 10s timeout and
+            long-lived keep-alive connections.
 
     Returns:
         Tuple of (TiKVSubject, TiKVInvariantChecker) instances ready for use.
@@ -49,9 +57,13 @@ def create_tikv_subject_and_checker(
         violations = checker.check(observation)
     """
     if pd_http is None:
-        pd_http = httpx.AsyncClient(base_url=pd_endpoint, timeout=10.0)
+        pd_http = httpx.AsyncClient(
+            base_url=pd_endpoint, timeout=10.0, limits=HTTP_LIMITS
+        )
     if prom_http is None:
-        prom_http = httpx.AsyncClient(base_url=prometheus_url, timeout=10.0)
+        prom_http = httpx.AsyncClient(
+            base_url=prometheus_url, timeout=10.0, limits=HTTP_LIMITS
+        )
 
     subject = TiKVSubject(
         pd=PDClient(http=pd_http),
@@ -235,23 +235,29 @@ class TiKVInvariantChecker:
 
         for store in stores:
             is_down = store.state != "Up"
-            current_down_stores.add(store.id) if is_down else None
+            if is_down:
+                current_down_stores.add(store.id)
 
             violation = self._check_with_grace_period(
                 config=config,
                 is_violated=is_down,
-                message=f"Store {store.id} at {store.address} is {store.state}",
+                # Only format a message when there is something to report
+                message=(
+                    f"Store {store.id} at {store.address} is {store.state}"
+                    if is_down
+                    else ""
+                ),
                 store_id=store.id,
             )
             if violation:
                 violations.append(violation)
 
         # Clear tracking for stores that came back up
+        prefix = f"{config.name}:"
         keys_to_clear = [
             key
             for key in self._first_seen
-            if key.startswith(f"{config.name}:")
-            and key.split(":", 1)[1] not in current_down_stores
+            if key.startswith(prefix) and key[len(prefix):] not in current_down_stores
         ]
         for key in keys_to_clear:
             self._first_seen.pop(key, None)
@@ -280,7 +286,11 @@ class TiKVInvariantChecker:
         return self._check_with_grace_period(
             config=config,
             is_violated=is_high,
-            message=f"Store {metrics.store_id} P99 latency {metrics.latency_p99_ms:.1f}ms exceeds threshold {config.threshold:.1f}ms",
+            message=(
+                f"Store {metrics.store_id} P99 latency {metrics.latency_p99_ms:.1f}ms exceeds threshold {config.threshold:.1f}ms"
+                if is_high
+                else ""
+            ),
             store_id=metrics.store_id,
         )
 
@@ -311,7 +321,11 @@ class TiKVInvariantChecker:
         return self._check_with_grace_period(
             config=config,
             is_violated=is_low,
-            message=f"Store {metrics.store_id} disk usage {usage_percent:.1f}% exceeds threshold {config.threshold:.1f}%",
+            message=(
+                f"Store {metrics.store_id} disk usage {usage_percent:.1f}% exceeds threshold {config.threshold:.1f}%"
+                if is_low
+                else ""
+            ),
             store_id=metrics.store_id,
         )
 
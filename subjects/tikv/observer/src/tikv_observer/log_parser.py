@@ -16,6 +16,7 @@ Per RESEARCH.md Pitfall 5:
 """
 
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -43,8 +44,14 @@ LEADERSHIP_KEYWORDS = [
     "leader election",
 ]
 
+# Single case-insensitive scan for any keyword, so lines don't need to be
+# lowercased into a new string just to be filtered
+LEADERSHIP_PATTERN = re.compile(
+    "|".join(re.escape(kw) for kw in LEADERSHIP_KEYWORDS), re.IGNORECASE
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """
     Parsed log line from TiKV/TiDB unified log format.
@@ -64,7 +71,7 @@ class LogEntry:
     fields: dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class LeadershipChange:
     """
     Leadership change event extracted from TiKV logs.
@@ -95,9 +102,8 @@ def parse_log_line(line: str) -> LogEntry | None:
         Returns None for empty lines, malformed lines, or unexpected formats.
         This ensures graceful handling without crashing.
     """
-    if not line or not line.strip():
-        return None
-
+    # Empty and whitespace-only lines fail the anchored match below, so no
+    # separate strip() check is needed
     match = LOG_PATTERN.match(line)
     if not match:
         return None
@@ -127,7 +133,7 @@ def parse_log_line(line: str) -> LogEntry | None:
     )
 
 
-def extract_leadership_changes(lines: list[str]) -> list[LeadershipChange]:
+def extract_leadership_changes(lines: Iterable[str]) -> list[LeadershipChange]:
     """
     Extract leadership change events from TiKV logs.
 
@@ -139,8 +145,12 @@ def extract_leadership_changes(lines: list[str]) -> list[LeadershipChange]:
                       "step down", "leader election"
     - Requires region_id field (skips lines without it)
 
+    Lines are consumed one at a time, so a log file or subprocess pipe can
+    be passed directly instead of being read into a list first.
+
     Args:
-        lines: List of raw log line strings
+        lines: Raw log lines (list, open file, or any iterable of str);
+            trailing newlines are tolerated
 
     Returns:
         List of LeadershipChange events with timestamp, region_id, and message.
@@ -150,8 +160,7 @@ def extract_leadership_changes(lines: list[str]) -> list[LeadershipChange]:
 
     for line in lines:
         # Check if line mentions leadership (case-insensitive)
-        line_lower = line.lower()
-        if not any(kw in line_lower for kw in LEADERSHIP_KEYWORDS):
+        if not LEADERSHIP_PATTERN.search(line):
             continue
 
         # Parse the log line
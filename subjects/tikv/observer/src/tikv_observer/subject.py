@@ -14,7 +14,8 @@ Per CONTEXT.md decisions:
 - Conservative resource thresholds (70%+)
 """
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from typing import Any
 
 from operator_protocols.types import ClusterMetrics, Store, StoreMetrics
@@ -35,6 +36,11 @@ class TiKVSubject:
     Attributes:
         pd: PDClient for cluster state queries
         prom: PrometheusClient for performance metrics
+        max_concurrent_metrics: Upper bound on per-store metric lookups
+            in flight at once during observe()
+
+    Store addresses are memoized from every PD store listing, so per-store
+    metric lookups do not re-query PD to resolve store_id -> address.
 
     Example:
         async with httpx.AsyncClient(base_url="http://pd:2379") as pd_http:
@@ -51,6 +57,15 @@ class TiKVSubject:
 
     pd: PDClient
     prom: PrometheusClient
+    max_concurrent_metrics: int = 8
+    _store_addresses: dict[str, str] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def _remember_stores(self, stores: list[Store]) -> list[Store]:
+        """Refresh the store_id -> address memo from a PD store listing."""
+        self._store_addresses = {s.id: s.address for s in stores}
+        return stores
 
     # -------------------------------------------------------------------------
     # SubjectProtocol.observe() - Generic observation interface
@@ -90,28 +105,38 @@ class TiKVSubject:
             blocking the entire observation.
         """
         # Get store states
-        stores = await self.pd.get_stores()
+        stores = self._remember_stores(await self.pd.get_stores())
+
+        # Get cluster-level metrics (reusing the store listing above)
+        cluster_metrics = await self._cluster_metrics(stores)
 
-        # Get cluster-level metrics
-        cluster_metrics = await self.get_cluster_metrics()
+        # Get per-store metrics for up stores, querying stores concurrently
+        # but bounded so large clusters don't burst Prometheus with requests
+        gate = asyncio.Semaphore(self.max_concurrent_metrics)
+
+        async def bounded_store_metrics(store_id: str) -> StoreMetrics:
+            async with gate:
+                return await self.get_store_metrics(store_id)
+
+        up_ids = [store.id for store in stores if store.state == "Up"]
+        results = await asyncio.gather(
+            *(bounded_store_metrics(store_id) for store_id in up_ids),
+            return_exceptions=True,
+        )
 
-        # Get per-store metrics for up stores
         store_metrics: dict[str, dict[str, Any]] = {}
-        for store in stores:
-            if store.state == "Up":
-                try:
-                    metrics = await self.get_store_metrics(store.id)
-                    store_metrics[store.id] = {
-                        "qps": metrics.qps,
-                        "latency_p99_ms": metrics.latency_p99_ms,
-                        "disk_used_bytes": metrics.disk_used_bytes,
-                        "disk_total_bytes": metrics.disk_total_bytes,
-                        "cpu_percent": metrics.cpu_percent,
-                        "raft_lag": metrics.raft_lag,
-                    }
-                except Exception:
-                    # Skip failed metrics - don't block observation
-                    pass
+        for store_id, metrics in zip(up_ids, results):
+            if isinstance(metrics, BaseException):
+                # Skip failed metrics - don't block observation
+                continue
+            store_metrics[store_id] = {
+                "qps": metrics.qps,
+                "latency_p99_ms": metrics.latency_p99_ms,
+                "disk_used_bytes": metrics.disk_used_bytes,
+                "disk_total_bytes": metrics.disk_total_bytes,
+                "cpu_percent": metrics.cpu_percent,
+                "raft_lag": metrics.raft_lag,
+            }
 
         return {
             "stores": [
@@ -138,7 +163,7 @@ class TiKVSubject:
         Returns:
             List of Store objects representing all TiKV nodes.
         """
-        return await self.pd.get_stores()
+        return self._remember_stores(await self.pd.get_stores())
 
     async def get_hot_write_regions(self) -> list[Region]:
         """
@@ -169,16 +194,18 @@ class TiKVSubject:
         Raises:
             ValueError: If store_id is not found in the cluster.
         """
-        # Get store address from PD
-        stores = await self.pd.get_stores()
-        store = next((s for s in stores if s.id == store_id), None)
-        if store is None:
+        # Resolve store address (memoized; query PD only on a miss)
+        address = self._store_addresses.get(store_id)
+        if address is None:
+            self._remember_stores(await self.pd.get_stores())
+            address = self._store_addresses.get(store_id)
+        if address is None:
             raise ValueError(f"Store {store_id} not found")
 
         # Get metrics from Prometheus using store address
         return await self.prom.get_store_metrics(
             store_id=store_id,
-            store_address=store.address,
+            store_address=address,
         )
 
     async def get_cluster_metrics(self) -> ClusterMetrics:
@@ -192,7 +219,11 @@ class TiKVSubject:
             ClusterMetrics containing store count, region count,
             and leader distribution.
         """
-        stores = await self.pd.get_stores()
+        stores = self._remember_stores(await self.pd.get_stores())
+        return await self._cluster_metrics(stores)
+
+    async def _cluster_metrics(self, stores: list[Store]) -> ClusterMetrics:
+        """Build cluster metrics from an existing PD store listing."""
         regions = await self.pd.get_regions()
 
         # Calculate leader count per store
@@ -25,7 +25,7 @@ RegionId = int
 """Unique identifier for a TiKV region (key range)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Region:
     """
     Represents a TiKV region (key range).
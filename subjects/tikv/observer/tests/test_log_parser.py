@@ -217,6 +217,23 @@ class TestExtractLeadershipChanges:
         assert len(changes) == 1
         assert changes[0].region_id == 123
 
+    def test_extract_streams_from_file_object(self):
+        """Extract accepts an open log file without reading it into a list."""
+        import io
+
+        from tikv_observer.log_parser import extract_leadership_changes
+
+        log_file = io.StringIO(
+            "[2024/01/15 14:20:11.015 +08:00] [INFO] [raftstore] [leader changed] [region_id=123]\n"
+            "[2024/01/15 14:20:12.015 +08:00] [INFO] [server] [connection accepted]\n"
+            "[2024/01/15 14:20:13.015 +08:00] [INFO] [raftstore] [became leader] [region_id=456]\n"
+        )
+
+        changes = extract_leadership_changes(log_file)
+
+        assert [c.region_id for c in changes] == [123, 456]
+        assert changes[1].message == "became leader"
+
 
 class TestLogEntryType:
     """Tests for LogEntry dataclass."""
@@ -5,6 +5,8 @@ Verifies that TiKVSubject and TiKVInvariantChecker correctly implement
 the generic protocols from operator-protocols package.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -67,6 +69,107 @@ class TestTiKVSubjectProtocolCompliance:
         assert "cluster_metrics" in result
         assert "store_metrics" in result
 
+    @pytest.mark.asyncio
+    async def test_observe_resolves_store_addresses_without_refetch(self):
+        """observe() should not re-query PD per store to resolve addresses."""
+        from operator_protocols.types import Store
+
+        mock_pd = AsyncMock()
+        mock_pd.get_stores.return_value = [
+            Store(id="1", address="tikv-0:20160", state="Up"),
+            Store(id="2", address="tikv-1:20160", state="Up"),
+        ]
+        mock_pd.get_regions.return_value = []
+        mock_prom = AsyncMock()
+
+        subject = TiKVSubject(pd=mock_pd, prom=mock_prom)
+        await subject.observe()
+
+        # Once for the observation (shared with cluster metrics); none per store
+        assert mock_pd.get_stores.await_count == 1
+        mock_prom.get_store_metrics.assert_any_await(
+            store_id="2", store_address="tikv-1:20160"
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [RuntimeError("prometheus unavailable"), asyncio.CancelledError()],
+    )
+    async def test_observe_skips_failed_store_metrics(self, error):
+        """A failing or cancelled store metric query should not drop the others."""
+        from operator_protocols.types import Store, StoreMetrics
+
+        mock_pd = AsyncMock()
+        mock_pd.get_stores.return_value = [
+            Store(id="1", address="tikv-0:20160", state="Up"),
+            Store(id="2", address="tikv-1:20160", state="Up"),
+            Store(id="3", address="tikv-2:20160", state="Down"),
+        ]
+        mock_pd.get_regions.return_value = []
+
+        async def store_metrics(store_id, store_address):
+            if store_id == "1":
+                raise error
+            return StoreMetrics(
+                store_id=store_id,
+                qps=1.0,
+                latency_p99_ms=2.0,
+                disk_used_bytes=3,
+                disk_total_bytes=4,
+                cpu_percent=5.0,
+                raft_lag=0,
+            )
+
+        mock_prom = AsyncMock()
+        mock_prom.get_store_metrics.side_effect = store_metrics
+
+        subject = TiKVSubject(pd=mock_pd, prom=mock_prom)
+        result = await subject.observe()
+
+        assert list(result["store_metrics"]) == ["2"]
+        assert mock_prom.get_store_metrics.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_observe_bounds_concurrent_store_metrics(self):
+        """Per-store metric lookups should not exceed max_concurrent_metrics."""
+        from operator_protocols.types import Store, StoreMetrics
+
+        mock_pd = AsyncMock()
+        mock_pd.get_stores.return_value = [
+            Store(id=str(i), address=f"tikv-{i}:20160", state="Up")
+            for i in range(6)
+        ]
+        mock_pd.get_regions.return_value = []
+
+        in_flight = 0
+        peak = 0
+
+        async def store_metrics(store_id, store_address):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return StoreMetrics(
+                store_id=store_id,
+                qps=1.0,
+                latency_p99_ms=2.0,
+                disk_used_bytes=3,
+                disk_total_bytes=4,
+                cpu_percent=5.0,
+                raft_lag=0,
+            )
+
+        mock_prom = AsyncMock()
+        mock_prom.get_store_metrics.side_effect = store_metrics
+
+        subject = TiKVSubject(pd=mock_pd, prom=mock_prom, max_concurrent_metrics=2)
+        result = await subject.observe()
+
+        assert len(result["store_metrics"]) == 6
+        assert peak == 2
+
 
 class TestTiKVInvariantCheckerProtocolCompliance:
     """Tests that TiKVInvariantChecker implements InvariantCheckerProtocol."""